@@ -1,5 +1,52 @@
 from bson import ObjectId
-from datetime import datetime
+from datetime import datetime, timezone
+from pymongo import UpdateOne
+import re
+import time
+
+# Short-lived cache for dashboard counts - these change slowly relative to
+# how often the stats endpoint polls them
+_COUNT_CACHE = {}
+_COUNT_TTL = 10  # seconds
+
+def _cached_count(key, fetch):
+    """Return a cached count, refreshing it when the TTL has expired"""
+    now = time.monotonic()
+    hit = _COUNT_CACHE.get(key)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+    value = fetch()
+    _COUNT_CACHE[key] = (value, now + _COUNT_TTL)
+    return value
+
+
+def _oid(value):
+    """Coerce a string id to ObjectId, passing ObjectId instances through"""
+    return value if isinstance(value, ObjectId) else ObjectId(value)
+
+
+# PyMongo builds a fresh Collection wrapper on every db[name] lookup; keep
+# one handle per (database, collection) for the hot paths
+_COLLECTION_CACHE = {}
+
+def _collection(db, name):
+    key = (id(db), name)
+    coll = _COLLECTION_CACHE.get(key)
+    if coll is None:
+        coll = _COLLECTION_CACHE.setdefault(key, db[name])
+    return coll
+
+
+def _stringify_ids(doc):
+    """Convert top-level ObjectId values to strings as documents leave the
+    model layer, so JSON encoding never has to fall back to a per-value
+    default hook"""
+    if doc:
+        for key, value in doc.items():
+            if isinstance(value, ObjectId):
+                doc[key] = str(value)
+    return doc
+
 
 class JobRole:
     """Model for job roles in the system"""
@@ -9,45 +56,49 @@ class JobRole:
     @staticmethod
     def create(db, job_data):
         """Create a new job role"""
-        job_data["createdAt"] = datetime.now()
-        job_data["updatedAt"] = datetime.now()
+        job_data["createdAt"] = datetime.now(timezone.utc)
+        job_data["updatedAt"] = datetime.now(timezone.utc)
         
         # Ensure skills is a list
         if "skills" in job_data and isinstance(job_data["skills"], str):
             job_data["skills"] = [s.strip() for s in job_data["skills"].split(",")]
         
-        result = db[JobRole.collection_name].insert_one(job_data)
+        result = _collection(db, JobRole.collection_name).insert_one(job_data)
         return str(result.inserted_id)
     
     @staticmethod
-    def get_all(db, limit=None, skip=0):
-        """Get all job roles"""
+    def get_all(db, limit=None, skip=0, projection=None):
+        """Get all job roles as a streaming cursor"""
         query = {}
-        cursor = db[JobRole.collection_name].find(query).sort("createdAt", -1)
-        
+        cursor = _collection(db, JobRole.collection_name).find(query, projection).sort("createdAt", -1)
+
         if skip:
             cursor = cursor.skip(skip)
         if limit:
             cursor = cursor.limit(limit)
-            
-        return list(cursor)
+
+        # Let callers consume incrementally instead of materializing the
+        # whole result set up front
+        return map(_stringify_ids, cursor.batch_size(500))
     
     @staticmethod
     def get_by_id(db, job_id):
         """Get a job role by ID"""
-        return db[JobRole.collection_name].find_one({"_id": ObjectId(job_id)})
+        return _stringify_ids(
+            _collection(db, JobRole.collection_name).find_one({"_id": _oid(job_id)})
+        )
     
     @staticmethod
     def update(db, job_id, job_data):
         """Update a job role"""
-        job_data["updatedAt"] = datetime.now()
+        job_data["updatedAt"] = datetime.now(timezone.utc)
         
         # Ensure skills is a list
         if "skills" in job_data and isinstance(job_data["skills"], str):
             job_data["skills"] = [s.strip() for s in job_data["skills"].split(",")]
         
-        result = db[JobRole.collection_name].update_one(
-            {"_id": ObjectId(job_id)},
+        result = _collection(db, JobRole.collection_name).update_one(
+            {"_id": _oid(job_id)},
             {"$set": job_data}
         )
         return result.modified_count > 0
@@ -55,13 +106,17 @@ class JobRole:
     @staticmethod
     def delete(db, job_id):
         """Delete a job role"""
-        result = db[JobRole.collection_name].delete_one({"_id": ObjectId(job_id)})
+        result = _collection(db, JobRole.collection_name).delete_one({"_id": _oid(job_id)})
         return result.deleted_count > 0
     
     @staticmethod
     def count(db):
         """Count total job roles"""
-        return db[JobRole.collection_name].count_documents({})
+        # estimated_document_count reads collection metadata in O(1)
+        return _cached_count(
+            (JobRole.collection_name, "all"),
+            lambda: _collection(db, JobRole.collection_name).estimated_document_count()
+        )
 
 
 class ResumeResult:
@@ -69,82 +124,190 @@ class ResumeResult:
     
     collection_name = "resume_results"
     
+    stats_collection_name = "stats"
+    _stats_id = "score_stats"
+
+    @staticmethod
+    def _update_score_stats(db, batch_sum, batch_count):
+        """Fold newly inserted scores into the running average document"""
+        if batch_count:
+            _collection(db, ResumeResult.stats_collection_name).update_one(
+                {"_id": ResumeResult._stats_id},
+                {"$inc": {"sum": batch_sum, "n": batch_count}},
+                upsert=True
+            )
+
     @staticmethod
     def create(db, result_data):
         """Create a new resume result"""
-        result_data["createdAt"] = datetime.now()
-        result_data["updatedAt"] = datetime.now()
-        
-        result = db[ResumeResult.collection_name].insert_one(result_data)
+        result_data["createdAt"] = datetime.now(timezone.utc)
+        result_data["updatedAt"] = datetime.now(timezone.utc)
+
+        result = _collection(db, ResumeResult.collection_name).insert_one(result_data)
+        if "score" in result_data:
+            ResumeResult._update_score_stats(db, result_data["score"], 1)
         return str(result.inserted_id)
     
     @staticmethod
     def create_many(db, results):
         """Create multiple resume results"""
+        # One timestamp for the whole batch - all docs share insertion time
+        now = datetime.now(timezone.utc)
         for result in results:
-            result["createdAt"] = datetime.now()
-            result["updatedAt"] = datetime.now()
-        
-        result = db[ResumeResult.collection_name].insert_many(results)
-        return [str(id) for id in result.inserted_ids]
+            result["createdAt"] = now
+            result["updatedAt"] = now
+
+        result = _collection(db, ResumeResult.collection_name).insert_many(results, ordered=False)
+        # One $inc with the batch totals keeps the running average in step
+        scored = [r["score"] for r in results if "score" in r]
+        ResumeResult._update_score_stats(db, sum(scored), len(scored))
+        # map runs the str() loop in C, without per-iteration frame overhead
+        return list(map(str, result.inserted_ids))
     
     @staticmethod
-    def get_all(db, filters=None, sort_by="score", sort_order=-1, page=1, limit=10):
+    def bulk_upsert(db, docs):
+        """Upsert multiple resume results in a single round-trip"""
+        now = datetime.now(timezone.utc)
+        ops = []
+        for doc in docs:
+            doc["updatedAt"] = now
+            # _id must stay out of the $set payload: writing it (as the
+            # string form callers hold) conflicts with the ObjectId in the
+            # filter and MongoDB rejects the op as an immutable-field
+            # write. Upsert-inserts take their _id from the filter.
+            update = {k: v for k, v in doc.items() if k != "_id"}
+            ops.append(UpdateOne({"_id": _oid(doc["_id"])}, {"$set": update}, upsert=True))
+        if not ops:
+            return 0
+
+        # One unordered OP_MSG instead of N separate update_one calls
+        result = _collection(db, ResumeResult.collection_name).bulk_write(ops, ordered=False)
+
+        # Upserts can overwrite existing scores, so the incremental
+        # sum/count in the stats doc can't be patched with a simple $inc.
+        # Drop it instead: the next get_average_score reseeds it with one
+        # full aggregate.
+        if any("score" in doc for doc in docs):
+            _collection(db, ResumeResult.stats_collection_name).delete_one(
+                {"_id": ResumeResult._stats_id}
+            )
+
+        return result.upserted_count + result.modified_count
+
+    @staticmethod
+    def get_all(db, filters=None, sort_by="score", sort_order=-1, page=1, limit=10,
+                projection=None):
         """Get all resume results with filtering and pagination"""
         query = filters or {}
         
         # Convert string IDs to ObjectId
         if "jobId" in query and query["jobId"]:
-            query["jobId"] = ObjectId(query["jobId"])
+            query["jobId"] = _oid(query["jobId"])
         
-        # Handle search
+        # Handle search - prefix-anchored so the collation index on
+        # name/email can serve it as a range scan
+        collation = None
         if "search" in query and query["search"]:
-            search_term = query.pop("search")
+            # Escape user input so it is treated as a literal prefix, not a
+            # pattern (also closes the ReDoS hole)
+            safe_term = re.escape(query.pop("search"))
             query["$or"] = [
-                {"name": {"$regex": search_term, "$options": "i"}},
-                {"email": {"$regex": search_term, "$options": "i"}}
+                {"name": {"$regex": f"^{safe_term}", "$options": "i"}},
+                {"email": {"$regex": f"^{safe_term}", "$options": "i"}}
             ]
+            collation = {"locale": "en", "strength": 2}
         
         # Determine sort field and order
         sort_field = sort_by
         sort_direction = 1 if sort_order == "asc" else -1
         
-        # Count total results for pagination
-        total = db[ResumeResult.collection_name].count_documents(query)
-        
-        # Get paginated results
+        # Fetch the page and the total count in a single round-trip so the
+        # filter only runs once
         skip = (page - 1) * limit
-        cursor = db[ResumeResult.collection_name].find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-        
-        return list(cursor), total
+        pipeline = [{"$match": query}]
+        if projection:
+            # Right after $match so the optimizer can push it down and skip
+            # fetching excluded fields
+            pipeline.append({"$project": projection})
+        pipeline.append(
+            {"$facet": {
+                "data": [
+                    # $sort immediately followed by $limit coalesces into a
+                    # bounded top-k heap of size skip+limit; the tie-breaking
+                    # _id keeps page boundaries stable
+                    {"$sort": {sort_field: sort_direction, "_id": 1}},
+                    {"$limit": skip + limit},
+                    {"$skip": skip}
+                ],
+                "total": [{"$count": "n"}]
+            }}
+        )
+        # Lock in the compound index when the query matches its shape; let
+        # oversized sorts spill to disk instead of failing at 100MiB.
+        # aggregate() forwards extra kwargs verbatim into the command
+        # document, so the hint must be a document (not find()'s
+        # list-of-tuples form) and must be omitted entirely when unused -
+        # the server rejects hint: null.
+        extra = {}
+        if "jobId" in query and sort_field == "score":
+            extra["hint"] = {"jobId": 1, "score": -1, "_id": 1}
+        facet = next(_collection(db, ResumeResult.collection_name).aggregate(
+            pipeline, collation=collation, allowDiskUse=True, **extra
+        ))
+        total = facet["total"][0]["n"] if facet["total"] else 0
+
+        return [_stringify_ids(doc) for doc in facet["data"]], total
     
     @staticmethod
     def get_by_id(db, result_id):
         """Get a resume result by ID"""
-        return db[ResumeResult.collection_name].find_one({"_id": ObjectId(result_id)})
+        return _stringify_ids(
+            _collection(db, ResumeResult.collection_name).find_one({"_id": _oid(result_id)})
+        )
     
     @staticmethod
     def get_by_batch(db, batch_id):
-        """Get resume results by batch ID"""
-        return list(db[ResumeResult.collection_name].find({"batchId": batch_id}))
+        """Get resume results by batch ID as a streaming cursor"""
+        cursor = _collection(db, ResumeResult.collection_name).find({"batchId": batch_id})
+        return map(_stringify_ids, cursor.batch_size(500))
     
     @staticmethod
     def count(db):
         """Count total resume results"""
-        return db[ResumeResult.collection_name].count_documents({})
-    
+        # estimated_document_count reads collection metadata in O(1)
+        return _cached_count(
+            (ResumeResult.collection_name, "all"),
+            lambda: _collection(db, ResumeResult.collection_name).estimated_document_count()
+        )
+
     @staticmethod
     def count_processed(db):
         """Count processed resume results"""
-        return db[ResumeResult.collection_name].count_documents({"processed": True})
+        return _cached_count(
+            (ResumeResult.collection_name, "processed"),
+            lambda: _collection(db, ResumeResult.collection_name).count_documents({"processed": True})
+        )
     
     @staticmethod
     def get_average_score(db):
         """Get average score of all resumes"""
+        # O(1) read of the incrementally maintained sum/count document
+        stats = _collection(db, ResumeResult.stats_collection_name).find_one(
+            {"_id": ResumeResult._stats_id}
+        )
+        if stats and stats.get("n"):
+            return stats["sum"] / stats["n"]
+
+        # No stats doc yet (pre-existing data): compute once and seed it
         pipeline = [
             {"$match": {"score": {"$exists": True}}},
-            {"$group": {"_id": None, "avgScore": {"$avg": "$score"}}}
+            {"$group": {"_id": None, "sum": {"$sum": "$score"}, "n": {"$sum": 1}}}
         ]
-        result = list(db[ResumeResult.collection_name].aggregate(pipeline))
-        return result[0]["avgScore"] if result else 0
+        result = list(_collection(db, ResumeResult.collection_name).aggregate(
+            pipeline, allowDiskUse=True
+        ))
+        if not result or not result[0]["n"]:
+            return 0
+        ResumeResult._update_score_stats(db, result[0]["sum"], result[0]["n"])
+        return result[0]["sum"] / result[0]["n"]
 
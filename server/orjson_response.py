@@ -0,0 +1,22 @@
+from bson import ObjectId
+from flask.json.provider import JSONProvider
+import orjson
+
+# orjson handles datetime/UUID natively; the default hook only needs to
+# cover BSON ObjectId
+def _default(obj):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster response serialization"""
+
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
@@ -3,19 +3,34 @@ import os
 import uuid
 from werkzeug.utils import secure_filename
 from bson import ObjectId
-import tempfile
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 import re
+import string
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; single-regex fallback below
+    ahocorasick = None
+try:
+    import spacy
+except ImportError:  # optional NER assist for name extraction
+    spacy = None
+import phonenumbers
 import docx2txt
 import PyPDF2
 import logging
 import fitz  # PyMuPDF
+import pypdfium2 as pdfium
 import io
+import mmap
 import traceback
 from models import JobRole, ResumeResult
 
@@ -28,50 +43,492 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 bp = Blueprint('api', __name__, url_prefix='/api')
 
-# Download NLTK resources
+# NLTK resources - only hit the network/disk when the corpora are actually
+# missing instead of running the download check on every process start
+def _ensure_nltk():
+    try:
+        stopwords.words('english')
+    except LookupError:
+        try:
+            nltk.download('punkt', quiet=True)
+            nltk.download('stopwords', quiet=True)
+        except Exception as e:
+            logger.error(f"Error downloading NLTK resources: {str(e)}")
+
+_ensure_nltk()
+
+# Loaded once; stopwords.words() returns a fresh list on every call
 try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-except Exception as e:
-    logger.error(f"Error downloading NLTK resources: {str(e)}")
+    STOPWORDS = frozenset(stopwords.words('english'))
+except LookupError:
+    STOPWORDS = frozenset()
 
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'pdf', 'docx'}
 
-# Add this function at the top of the file, after the imports
+# Optional linear-time regex engine for the hot alternation patterns: RE2
+# guarantees O(n) matching even on adversarial resume text, where the
+# stdlib backtracking engine can go super-linear. Purely optional - without
+# the google-re2 package everything compiles with the stdlib engine.
+try:
+    import re2 as re_fast
+except ImportError:
+    re_fast = re
+
+# Patterns compiled once at import - these run on every uploaded resume, and
+# per-call re.* lookups pay a cache hash + lock each time
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PAREN_RE = re.compile(r'\(\d{3}\)[-\s]?\d{3}[-\s]?\d{4}')
+PHONE_10_DIGIT_RE = re.compile(r'\b\d{10}\b')
+NAME_PATTERNS = [
+    re.compile(r'^[A-Z][a-z]+ [A-Z][a-z]+$'),                      # First Last
+    re.compile(r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$'),              # First M. Last
+    re.compile(r'^[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+$')           # First Middle Last
+]
+NAME_SKIP_RE = re.compile(r'@|www|\d{3}|resume|cv|curriculum|vitae|address|email|phone|tel|contact')
+SECTION_BREAK_RE = re.compile(r'\n\s*\n')
+# The separator is one optional dash-or-'to', not [-\u2013\u2014to]* which
+# overlapped with the surrounding \s* and invited backtracking on near
+# misses; groups are non-capturing since no caller reads submatches
+DATE_RANGE_RE = re_fast.compile(
+    r'(?:19|20)\d{2}\s*(?:[-\u2013\u2014]|to)?\s*(?:(?:19|20)\d{2}|present|current|now)')
+YEAR_RE = re.compile(r'(19|20)\d{2}')
+BULLET_ITEM_RE = re.compile(r'[\u2022\-*]\s*([^\u2022\-*\n]+)')
+# startswith on this tuple is far cheaper than dispatching a regex for a
+# one-character class on every line
+BULLET_CHARS = ('\u2022', '-', '*')
+DEGREE_RES = [
+    re_fast.compile(r'(bachelor|master|phd|doctorate|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|b\.?tech|m\.?tech|b\.?e\.?|m\.?e\.?|mba)'),
+    re_fast.compile(r'(associate|diploma|certificate)')
+]
+INSTITUTION_RE = re_fast.compile(r'(university|college|institute|school|academy)')
+# Cheap substring gates run before the institution/degree regexes on every
+# line: C-level 'in' rejects most lines without paying regex start-up cost.
+# Each tuple is a superset of what its regex can match, so gating never
+# changes the outcome.
+_INST_KEYWORDS = ('university', 'college', 'institute', 'school', 'academy')
+_DEGREE_KEYWORDS = ('bachelor', 'master', 'phd', 'doctorate', 'mba',
+                    'associate', 'diploma', 'certificate',
+                    'bs', 'b.s', 'ms', 'm.s', 'ba', 'b.a', 'ma', 'm.a',
+                    'btech', 'b.tech', 'mtech', 'm.tech',
+                    'be', 'b.e', 'me', 'm.e')
+WORD_RE = re.compile(r'\b\w+\b')
+# Translation table mapping punctuation to spaces - str.translate is a
+# C-level table lookup, faster than a character-class regex sub on
+# resume-sized strings. Covers ASCII plus the punctuation resumes
+# actually use (bullets, en/em dashes, curly quotes).
+_PUNCT_TABLE = str.maketrans({
+    c: ' ' for c in string.punctuation + '•·–—‘’“”'
+})
+COMMA_LIST_RE = re.compile(r'([^\u2022\-*\n:]+(?:,\s*[^,\n]+)+)')
+# Canonical section -> every header synonym that introduces it. This single
+# table drives the combined header regex below; adding a synonym here is the
+# only change needed to recognize a new header. 'other' entries only serve
+# to terminate the section before them.
+ALL_HEADERS = {
+    'skills': ('skills', 'technical skills', 'core competencies',
+               'technologies', 'proficiencies'),
+    'experience': ('experience', 'work experience', 'professional experience',
+                   'employment history', 'work history'),
+    'projects': ('projects', 'personal projects', 'academic projects',
+                 'key projects', 'relevant projects'),
+    'education': ('education', 'academic background',
+                  'academic qualifications', 'educational qualifications'),
+    'certifications': ('certifications', 'certificates',
+                       'professional certifications', 'credentials'),
+    'other': ('awards', 'languages', 'interests', 'references',
+              'summary', 'objective'),
+}
+# One named group per canonical section, synonyms longest-first inside each
+# group so 'work experience' is not cut short by 'experience'. parse_text
+# locates all headers in ONE finditer pass and reads the section straight
+# off match.lastgroup - no synonym-to-section lookup per hit.
+SECTION_HEADER_RE = re_fast.compile(
+    r'(?m)^[ \t]*(?:' + '|'.join(
+        '(?P<%s>%s)' % (section, '|'.join(sorted(headers, key=len, reverse=True)))
+        for section, headers in ALL_HEADERS.items()
+    ) + r')[:\s]*$')
+JOB_TITLE_RES = [
+    re.compile(r'(senior|junior|lead|principal|staff)?\s*(software|web|mobile|frontend|backend|full stack|devops|cloud|data|machine learning|ai|product|project)?\s*(developer|engineer|architect|manager|designer|analyst|scientist|specialist|consultant)'),
+    re.compile(r'(cto|ceo|cio|vp|director|head|chief)\s*(technology|information|product|engineering|technical|executive|operating)'),
+    re.compile(r'(intern|internship|co-op|trainee|graduate)')
+]
+SKILL_CONTEXT_RES = [
+    re.compile(r'proficient in\s+([^.,:;]+)'),
+    re.compile(r'experience with\s+([^.,:;]+)'),
+    re.compile(r'knowledge of\s+([^.,:;]+)'),
+    re.compile(r'familiar with\s+([^.,:;]+)'),
+    re.compile(r'skilled in\s+([^.,:;]+)'),
+    re.compile(r'worked with\s+([^.,:;]+)'),
+    re.compile(r'expertise in\s+([^.,:;]+)'),
+    re.compile(r'specialized in\s+([^.,:;]+)')
+]
+
+# Common technical skills - expanded list (module scope: shared by the
+# matching automaton below)
+COMMON_SKILLS = (
+    'python', 'java', 'javascript', 'html', 'css', 'react', 'angular', 'vue', 
+    'node.js', 'express', 'django', 'flask', 'spring', 'hibernate', 'sql', 
+    'mysql', 'postgresql', 'mongodb', 'nosql', 'aws', 'azure', 'gcp', 'docker', 
+    'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 'ci/cd', 'agile', 'scrum', 
+    'jira', 'confluence', 'machine learning', 'deep learning', 'ai', 'data science', 
+    'data analysis', 'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'scipy', 
+    'matplotlib', 'tableau', 'power bi', 'excel', 'word', 'powerpoint', 'photoshop', 
+    'illustrator', 'figma', 'sketch', 'ui/ux', 'responsive design', 'mobile development', 
+    'ios', 'android', 'swift', 'kotlin', 'flutter', 'react native', 'c', 'c++', 'c#', 
+    'php', 'ruby', 'rails', 'scala', 'go', 'rust', 'typescript', 'jquery', 'bootstrap', 
+    'tailwind', 'sass', 'less', 'redux', 'graphql', 'rest api', 'soap', 'microservices', 
+    'serverless', 'linux', 'unix', 'windows', 'macos', 'bash', 'powershell', 'networking', 
+    'security', 'penetration testing', 'ethical hacking', 'blockchain', 'cryptocurrency', 
+    'smart contracts', 'solidity', 'web3', 'devops', 'sre', 'cloud computing', 'big data', 
+    'hadoop', 'spark', 'kafka', 'elasticsearch', 'logstash', 'kibana', 'data warehousing', 
+    'etl', 'business intelligence', 'project management', 'leadership', 'communication', 
+    'problem solving', 'critical thinking', 'teamwork', 'time management', 'creativity',
+    'mern', 'mean', 'full stack', 'frontend', 'backend', 'web development', 'mobile app',
+    'database', 'api', 'rest', 'soap', 'json', 'xml', 'http', 'tcp/ip', 'dns', 'ssl',
+    'tls', 'oauth', 'jwt', 'authentication', 'authorization', 'encryption', 'hashing',
+    'testing', 'unit testing', 'integration testing', 'e2e testing', 'qa', 'quality assurance',
+    'debugging', 'performance optimization', 'seo', 'analytics', 'marketing', 'sales',
+    'customer service', 'support', 'helpdesk', 'technical writing', 'documentation',
+    'node', 'npm', 'yarn', 'webpack', 'babel', 'eslint', 'prettier', 'jest', 'mocha', 'chai',
+    'cypress', 'selenium', 'postman', 'swagger', 'openapi', 'firebase', 'supabase', 'amplify',
+    'vercel', 'netlify', 'heroku', 'digital ocean', 'linode', 'ec2', 's3', 'lambda', 'dynamodb',
+    'rds', 'aurora', 'redis', 'memcached', 'nginx', 'apache', 'iis', 'tomcat', 'websocket',
+    'webrtc', 'pwa', 'spa', 'ssr', 'ssg', 'jamstack', 'cms', 'wordpress', 'drupal', 'joomla',
+    'magento', 'shopify', 'woocommerce', 'ecommerce', 'payment gateway', 'stripe', 'paypal',
+    'braintree', 'square', 'authorize.net', 'seo', 'sem', 'smm', 'content marketing', 'email marketing',
+    'affiliate marketing', 'growth hacking', 'a/b testing', 'user research', 'user testing',
+    'usability testing', 'accessibility', 'wcag', 'aria', 'screen reader', 'keyboard navigation',
+    'responsive web design', 'mobile first', 'progressive enhancement', 'graceful degradation',
+    'cross-browser compatibility', 'cross-platform compatibility', 'internationalization', 'localization',
+    'i18n', 'l10n', 'rtl', 'ltr', 'unicode', 'utf-8', 'ascii', 'character encoding', 'emoji',
+    'svg', 'canvas', 'webgl', 'three.js', 'd3.js', 'chart.js', 'highcharts', 'plotly', 'leaflet',
+    'mapbox', 'google maps', 'bing maps', 'openstreetmap', 'geolocation', 'geocoding', 'reverse geocoding',
+    'push notifications', 'service worker', 'web worker', 'indexeddb', 'localstorage', 'sessionstorage',
+    'cookies', 'jwt', 'oauth', 'openid connect', 'saml', 'ldap', 'active directory', 'kerberos',
+    'sso', 'mfa', '2fa', 'biometric authentication', 'facial recognition', 'fingerprint recognition',
+    'voice recognition', 'iris recognition', 'retina recognition', 'palm recognition', 'vein recognition',
+    'behavioral biometrics', 'keystroke dynamics', 'gait analysis', 'signature recognition',
+    'handwriting recognition', 'speech recognition', 'natural language processing', 'nlp',
+    'sentiment analysis', 'entity recognition', 'text classification', 'text summarization',
+    'machine translation', 'speech synthesis', 'text to speech', 'speech to text', 'chatbot',
+    'virtual assistant', 'conversational ai', 'dialog system', 'intent recognition', 'entity extraction',
+    'slot filling', 'context management', 'dialog management', 'dialog flow', 'dialog state tracking',
+    'dialog policy', 'dialog generation', 'dialog evaluation', 'dialog annotation', 'dialog corpus',
+    'dialog dataset', 'dialog system evaluation', 'dialog system annotation', 'dialog system corpus',
+    'dialog system dataset', 'dialog system benchmark', 'dialog system challenge', 'dialog system competition',
+    # HR skills
+    'recruiting', 'talent acquisition', 'onboarding', 'offboarding', 'employee relations',
+    'benefits administration', 'compensation', 'payroll', 'hr policies', 'hr compliance',
+    'performance management', 'succession planning', 'workforce planning', 'employee engagement',
+    'diversity and inclusion', 'training and development', 'organizational development',
+    'change management', 'conflict resolution', 'labor relations', 'collective bargaining',
+    'hris', 'applicant tracking system', 'ats', 'workday', 'sap hr', 'peoplesoft',
+    'oracle hcm', 'bamboo hr', 'greenhouse', 'lever', 'indeed', 'linkedin recruiter',
+    # Finance skills
+    'accounting', 'financial analysis', 'financial reporting', 'budgeting', 'forecasting',
+    'financial planning', 'financial modeling', 'cost accounting', 'tax preparation',
+    'tax planning', 'audit', 'risk assessment', 'compliance', 'sarbanes-oxley', 'sox',
+    'gaap', 'ifrs', 'bookkeeping', 'accounts payable', 'accounts receivable', 'general ledger',
+    'balance sheet', 'income statement', 'cash flow statement', 'financial statements',
+    'quickbooks', 'sap finance', 'oracle financials', 'sage', 'xero', 'excel financial functions',
+    # Marketing skills
+    'digital marketing', 'content marketing', 'social media marketing', 'email marketing',
+    'search engine optimization', 'search engine marketing', 'pay-per-click', 'ppc',
+    'google ads', 'facebook ads', 'instagram ads', 'twitter ads', 'linkedin ads',
+    'conversion rate optimization', 'a/b testing', 'marketing automation', 'customer segmentation',
+    'customer journey mapping', 'brand management', 'product marketing', 'market research',
+    'competitive analysis', 'google analytics', 'adobe analytics', 'hubspot', 'marketo',
+    'mailchimp', 'constant contact', 'hootsuite', 'buffer', 'canva', 'adobe creative suite',
+    # Sales skills
+    'sales strategy', 'sales management', 'account management', 'business development',
+    'lead generation', 'lead qualification', 'cold calling', 'sales presentations',
+    'negotiation', 'closing techniques', 'customer relationship management', 'crm',
+    'salesforce', 'hubspot crm', 'zoho crm', 'pipedrive', 'sales forecasting',
+    'territory management', 'channel sales', 'direct sales', 'inside sales', 'outside sales',
+    # Customer service skills
+    'customer support', 'customer success', 'technical support', 'help desk',
+    'service desk', 'call center', 'customer satisfaction', 'customer retention',
+    'complaint resolution', 'service level agreements', 'sla', 'zendesk', 'freshdesk',
+    'intercom', 'live chat', 'ticketing systems', 'knowledge base management',
+    # Operations skills
+    'operations management', 'supply chain management', 'inventory management',
+    'logistics', 'warehouse management', 'procurement', 'vendor management',
+    'quality control', 'quality assurance', 'process improvement', 'lean', 'six sigma',
+    'kaizen', 'erp systems', 'sap', 'oracle', 'netsuite', 'microsoft dynamics',
+    # Project management skills
+    'project management', 'program management', 'portfolio management', 'agile',
+    'scrum', 'kanban', 'waterfall', 'prince2', 'pmp', 'project planning',
+    'resource allocation', 'risk management', 'stakeholder management',
+    'microsoft project', 'asana', 'trello', 'jira', 'basecamp', 'smartsheet',
+    # Legal skills
+    'contract law', 'corporate law', 'intellectual property', 'patents',
+    'trademarks', 'copyrights', 'compliance', 'regulatory affairs', 'legal research',
+    'legal writing', 'litigation', 'arbitration', 'mediation', 'negotiation',
+    'westlaw', 'lexisnexis', 'docusign', 'e-discovery', 'legal document management',
+    # Healthcare skills
+    'patient care', 'clinical documentation', 'medical coding', 'medical billing',
+    'electronic health records', 'ehr', 'epic', 'cerner', 'meditech', 'allscripts',
+    'hipaa compliance', 'healthcare compliance', 'clinical trials', 'medical research',
+    'telehealth', 'telemedicine', 'healthcare administration', 'healthcare management',
+    # Education skills
+    'curriculum development', 'instructional design', 'e-learning', 'lms',
+    'learning management systems', 'blackboard', 'canvas', 'moodle', 'google classroom',
+    'student assessment', 'educational technology', 'classroom management',
+    'special education', 'iep', 'differentiated instruction', 'student engagement',
+    # Data science skills
+    'data analysis', 'data mining', 'data visualization', 'statistical analysis',
+    'predictive modeling', 'machine learning', 'deep learning', 'natural language processing',
+    'computer vision', 'big data', 'data warehousing', 'etl', 'sql', 'nosql',
+    'r', 'python', 'sas', 'spss', 'stata', 'matlab', 'tableau', 'power bi',
+    'looker', 'qlik', 'd3.js', 'hadoop', 'spark', 'aws redshift', 'google bigquery',
+    'azure synapse', 'snowflake', 'data lake', 'data governance', 'data quality',
+    # Soft skills
+    'communication', 'teamwork', 'leadership', 'problem solving', 'critical thinking',
+    'decision making', 'time management', 'organization', 'adaptability', 'flexibility',
+    'creativity', 'innovation', 'emotional intelligence', 'conflict resolution',
+    'negotiation', 'persuasion', 'presentation skills', 'public speaking',
+    'active listening', 'written communication', 'verbal communication',
+    'interpersonal skills', 'customer service', 'attention to detail',
+    'multitasking', 'work ethic', 'self-motivation', 'resilience', 'stress management'
+)
+COMMON_SKILLS_SET = frozenset(COMMON_SKILLS)
+
+# Education keywords shared by extract_college (hoisted so the list is not
+# rebuilt per call)
+EDU_KEYWORDS = frozenset([
+    'university', 'college', 'institute', 'school', 'academy', 'polytechnic',
+    'bachelor', 'master', 'phd', 'degree', 'b.tech', 'm.tech', 'b.e.', 'm.e.',
+    'b.sc', 'm.sc', 'b.a.', 'm.a.', 'mba', 'bba', 'education'
+])
+EDU_TOKEN_RE = re.compile(r'[a-z.]+')
+# Keyword set with trailing periods stripped so normalized line tokens
+# compare like with like ('b.e.' and a line's 'b.e' both become 'b.e')
+_EDU_KEYWORDS_NORM = frozenset(k.rstrip('.') for k in EDU_KEYWORDS)
+
+# One automaton matches every skill in a single linear pass over the text
+# instead of one regex scan per skill. Without pyahocorasick, a single
+# compiled alternation (longest-first so 'machine learning' beats
+# 'machine') still scans the text in roughly one pass via re's prefix trie.
+if ahocorasick is not None:
+    SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill in set(COMMON_SKILLS):
+        SKILL_AUTOMATON.add_word(_skill, _skill)
+    SKILL_AUTOMATON.make_automaton()
+    SKILL_ALTERNATION_RE = None
+else:
+    SKILL_AUTOMATON = None
+    SKILL_ALTERNATION_RE = re.compile(
+        r'\b(' + '|'.join(re.escape(s) for s in sorted(COMMON_SKILLS_SET, key=len, reverse=True)) + r')\b'
+    )
+
+def _scan_skills(text_lower):
+    """Find every known skill in lowercased text in a single pass"""
+    if SKILL_AUTOMATON is not None:
+        found = set()
+        for end_pos, skill in SKILL_AUTOMATON.iter(text_lower):
+            start_pos = end_pos - len(skill) + 1
+            if _word_boundary_ok(text_lower, start_pos, end_pos + 1):
+                found.add(skill)
+        return found
+    return set(SKILL_ALTERNATION_RE.findall(text_lower))
+
+def _word_boundary_ok(text, start, end):
+    """Emulate regex \\b around an automaton hit: the characters just
+    before and after the match must not be word characters"""
+    if start > 0:
+        prev = text[start - 1]
+        if prev.isalnum() or prev == '_':
+            return False
+    if end < len(text):
+        nxt = text[end]
+        if nxt.isalnum() or nxt == '_':
+            return False
+    return True
+
+@dataclass
+class ParsedText:
+    """One-pass view of a resume shared by every extractor, so the same
+    bytes are not re-lowered and re-split per extraction"""
+    raw: str
+    lower: str
+    lines: list
+    nonempty: list
+    sections: dict  # canonical section name -> (start, end) span
+
+
+def parse_text(text):
+    """Tokenize resume text once for all downstream extractors"""
+    lines = [line.strip() for line in text.splitlines()]
+    lower = text.lower()
+    
+    # One pass locates every section header; each section spans from the end
+    # of its header line to the start of the next header (first hit wins)
+    sections = {}
+    matches = list(SECTION_HEADER_RE.finditer(lower))
+    for idx, match in enumerate(matches):
+        name = match.lastgroup
+        if name == 'other' or name in sections:
+            continue
+        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(lower)
+        sections[name] = (match.end(), end)
+    
+    return ParsedText(
+        raw=text,
+        lower=lower,
+        lines=lines,
+        nonempty=[line for line in lines if line],
+        sections=sections,
+    )
+
+
+def _parsed(text):
+    """Accept either raw text or an already-built ParsedText"""
+    return text if isinstance(text, ParsedText) else parse_text(text)
+
+
+def _finalize_parts(entry, key):
+    """Collapse the accumulated '<key>_parts' line list into entry[key].
+    Appending lines and joining once keeps multi-line descriptions linear
+    instead of re-copying the string per line"""
+    parts = entry.pop(key + '_parts', None)
+    if parts:
+        entry[key] = ' '.join(parts)
+    return entry
+
+
+# Types that need converting before JSON encoding; everything else passes
+# through untouched
+_SERIALIZERS = {ObjectId: str, datetime: datetime.isoformat}
+
 def serialize_doc(doc):
-    """Convert MongoDB document to serializable format"""
-    if doc is None:
-        return None
-    
-    if isinstance(doc, list):
+    """Convert MongoDB document to serializable format.
+
+    Returns a new structure instead of assigning back into the caller's
+    document, and dispatches on exact type - an exact-type lookup is cheaper
+    than chained isinstance checks for the common primitive case.
+    """
+    t = type(doc)
+    if t is dict:
+        return {key: serialize_doc(value) for key, value in doc.items()}
+    if t is list:
         return [serialize_doc(item) for item in doc]
-    
-    if isinstance(doc, dict):
-        for key, value in doc.items():
-            if isinstance(value, ObjectId):
-                doc[key] = str(value)
-            elif isinstance(value, datetime):
-                doc[key] = value.isoformat()
-            elif isinstance(value, (dict, list)):
-                doc[key] = serialize_doc(value)
-    return doc
+    fn = _SERIALIZERS.get(t)
+    return fn(doc) if fn else doc
+
+# Per-file extraction is CPU-bound (MuPDF parsing plus regex scanning), so
+# batch uploads fan out across a process pool. Created lazily: gunicorn
+# workers fork after import, and a pool inherited across a fork is unusable.
+# Module-level constants (compiled regexes, the skill automaton) are rebuilt
+# once per worker process at import time.
+_EXECUTOR = None
+
+def _get_executor():
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _EXECUTOR
+
+
+def _parse_one(item):
+    """Extract text and contact fields for one upload. Runs in a pool
+    worker, so it only takes (filename, bytes) and returns a plain
+    picklable dict"""
+    filename, data = item
+    try:
+        resume_text = extract_text_from_bytes(data, filename.rsplit('.', 1)[-1].lower())
+        if not resume_text or len(resume_text) < 50:
+            return {"text": resume_text or "", "name": "Unknown",
+                    "email": None, "phone": None, "college": None}
+        email, phone = extract_contact_info(resume_text)
+        return {
+            "text": resume_text,
+            "name": extract_name(resume_text),
+            "email": email,
+            "phone": phone,
+            "college": extract_college(resume_text),
+        }
+    except Exception as e:
+        return {"error": str(e), "traceback": traceback.format_exc()}
+
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 def extract_text_from_pdf(file_path):
-    """Extract text from PDF file using multiple methods for better reliability"""
+    """Extract text from a PDF on disk, memory-mapped for parsing"""
+    try:
+        with open(file_path, 'rb') as f:
+            # mmap hands the parser a zero-copy view: the kernel pages in
+            # only the regions actually touched instead of the whole file
+            # being copied into a Python bytes object up front. fitz wants
+            # bytes or memoryview, so wrap the map rather than read it.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return extract_text_from_pdf_bytes(memoryview(mm))
+    except (OSError, ValueError) as e:
+        # ValueError covers zero-length files, which cannot be mapped
+        logger.error(f"Could not read PDF {file_path}: {str(e)}")
+        return ""
+
+# Documents below this page count are extracted sequentially - re-parsing
+# the PDF per worker costs more than it saves on short resumes
+_PAGE_PARALLEL_THRESHOLD = 8
+
+def _extract_page_range(data, start, stop):
+    """Extract a contiguous page range with a private Document handle -
+    PyMuPDF documents are not safe to share across threads, but the C
+    extraction code releases the GIL, so one document per thread scales"""
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        return "\n".join(
+            doc[i].get_text(
+                "text",
+                flags=fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE,
+                sort=False,
+            )
+            for i in range(start, stop)
+        )
+
+def extract_text_from_pdf_bytes(data):
+    """Extract text from PDF bytes using multiple methods for better reliability"""
     text = ""
-    
+
     # Method 1: PyMuPDF (primary method)
     try:
-        logger.info(f"Attempting to extract text from PDF using PyMuPDF: {file_path}")
-        doc = fitz.open(file_path)
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            page_text = page.get_text("text")
-            text += page_text
+        logger.info(f"Attempting to extract text from PDF using PyMuPDF ({len(data)} bytes)")
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            # Scanned resumes are image-only PDFs. Only single-page
+            # documents are safe to give up on from a page-one probe - a
+            # multi-page resume may just have an image cover page with the
+            # text further in, and it should still reach the fallback
+            # parsers if fitz finds nothing
+            if doc.page_count == 1:
+                first = doc[0]
+                if len(first.get_text("text").strip()) < 20 and first.get_images():
+                    logger.warning("PDF appears to be scanned (image-only, no text layer); "
+                                   "skipping text extraction")
+                    return ""
+            n_pages = doc.page_count
+            if n_pages >= _PAGE_PARALLEL_THRESHOLD:
+                # Long documents: fan page ranges out across threads, each
+                # with its own document over the same buffer
+                step = -(-n_pages // 4)  # ceil division into 4 ranges
+                ranges = [(i, min(i + step, n_pages)) for i in range(0, n_pages, step)]
+                with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+                    parts = list(ex.map(lambda r: _extract_page_range(data, *r), ranges))
+                text = "\n".join(parts)
+            else:
+                # join builds the result in one allocation instead of O(n^2)
+                # incremental string concatenation. Plain-text flags skip image
+                # decoding and layout sorting - keyword matching doesn't need
+                # reading-order reconstruction
+                text = "\n".join(
+                    page.get_text(
+                        "text",
+                        flags=fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE,
+                        sort=False,
+                    )
+                    for page in doc
+                )
         
         logger.info(f"PyMuPDF extracted {len(text)} characters")
         if text.strip():
@@ -79,17 +536,31 @@ def extract_text_from_pdf(file_path):
     except Exception as e:
         logger.error(f"PyMuPDF extraction failed: {str(e)}")
     
-    # Method 2: PyPDF2 (fallback method)
+    # Method 2: pypdfium2 (first fallback - much faster than PyPDF2)
+    try:
+        logger.info("Falling back to pypdfium2 extraction")
+        # pdfium takes bytes directly but not a memoryview; BytesIO copies,
+        # which is acceptable on this rarely-taken fallback path
+        pdf = pdfium.PdfDocument(data if isinstance(data, bytes) else io.BytesIO(data))
+        try:
+            text = "\n".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+        
+        logger.info(f"pypdfium2 extracted {len(text)} characters")
+        if text.strip():
+            return text
+    except Exception as e:
+        logger.error(f"pypdfium2 extraction failed: {str(e)}")
+    
+    # Method 3: PyPDF2 (last-resort fallback)
     try:
         logger.info("Falling back to PyPDF2 extraction")
-        text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+        # Collect pages and join once - += copies the whole string per
+        # page, making long PDFs quadratic
+        chunks = [page.extract_text() for page in pdf_reader.pages]
+        text = "\n".join(chunk for chunk in chunks if chunk)
         
         logger.info(f"PyPDF2 extracted {len(text)} characters")
         if text.strip():
@@ -103,28 +574,87 @@ def extract_text_from_pdf(file_path):
     
     return text
 
+def extract_header_text(file_path, max_chars=3000):
+    """Extract just the top of a PDF for contact-info scans.
+
+    Resumes put name/email/phone on page one; accumulating page text and
+    stopping as soon as an email turns up (or the budget is spent) avoids
+    decoding the rest of a multi-page document."""
+    try:
+        with fitz.open(file_path) as doc:
+            parts = []
+            size = 0
+            for page in doc:
+                part = page.get_text(
+                    "text",
+                    flags=fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE,
+                    sort=False,
+                )
+                parts.append(part)
+                size += len(part)
+                if size >= max_chars or EMAIL_RE.search(part):
+                    break
+            return "\n".join(parts)[:max_chars]
+    except Exception as e:
+        logger.error(f"Header extraction failed for {file_path}: {str(e)}")
+        return ""
+
 def extract_text_from_docx(file_path):
-    """Extract text from DOCX file"""
+    """Extract text from a DOCX on disk (read once, parsed in memory)"""
     try:
-        logger.info(f"Extracting text from DOCX: {file_path}")
-        text = docx2txt.process(file_path)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        logger.error(f"Could not read DOCX {file_path}: {str(e)}")
+        return ""
+    return extract_text_from_docx_bytes(data)
+
+def extract_text_from_docx_bytes(data):
+    """Extract text from DOCX bytes"""
+    try:
+        logger.info(f"Extracting text from DOCX ({len(data)} bytes)")
+        text = docx2txt.process(io.BytesIO(data))
         logger.info(f"Extracted {len(text)} characters from DOCX")
         return text
     except Exception as e:
         logger.error(f"Error extracting text from DOCX: {str(e)}")
         return ""
 
+# Re-uploads of the same resume are common in an ATS; remember extracted
+# text by content hash so repeat uploads skip the parsing pipeline entirely
+_TEXT_CACHE = OrderedDict()
+_TEXT_CACHE_MAX = 512
+
 def extract_text(file_path):
-    """Extract text from file based on extension"""
+    """Extract text from a file on disk based on extension"""
     logger.info(f"Extracting text from file: {file_path}")
-    
-    if file_path.endswith('.pdf'):
-        text = extract_text_from_pdf(file_path)
-    elif file_path.endswith('.docx'):
-        text = extract_text_from_docx(file_path)
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        logger.error(f"Could not read file {file_path}: {str(e)}")
+        return ""
+    return extract_text_from_bytes(data, file_path.rsplit('.', 1)[-1].lower())
+
+def extract_text_from_bytes(data, ext):
+    """Extract text from an in-memory upload (memoized by content hash)"""
+    digest = hashlib.sha1(data).hexdigest()
+    
+    if digest in _TEXT_CACHE:
+        _TEXT_CACHE.move_to_end(digest)
+        logger.info("Reusing cached text for previously seen file content")
+        text = _TEXT_CACHE[digest]
+    elif ext == 'pdf':
+        text = extract_text_from_pdf_bytes(data)
+    elif ext == 'docx':
+        text = extract_text_from_docx_bytes(data)
     else:
         text = ""
-        logger.warning(f"Unsupported file type: {file_path}")
+        logger.warning(f"Unsupported file type: .{ext}")
+    
+    _TEXT_CACHE[digest] = text
+    if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+        _TEXT_CACHE.popitem(last=False)
     
     # Log the first 100 characters of extracted text for debugging
     if text:
@@ -142,28 +672,27 @@ def extract_contact_info(text):
         return None, None
     
     # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_matches = re.findall(email_pattern, text)
+    email_matches = EMAIL_RE.findall(text)
     email = email_matches[0] if email_matches else None
     
-    # Extract phone number with simplified patterns
+    # Extract phone number
     phone = None
     
-    # Simple pattern for international numbers with country code
-    pattern1 = r'\+\d{1,3}[-\s]?\d{3}[-\s]?\d{3}[-\s]?\d{4}'
-    matches = re.findall(pattern1, text)
-    if matches:
-        phone = matches[0]
-    else:
+    # phonenumbers finds and validates numbers in one C-level pass; with no
+    # default region it only recognizes numbers carrying a country code, so
+    # the regex fallbacks below still cover bare national formats
+    for match in phonenumbers.PhoneNumberMatcher(text, None):
+        phone = phonenumbers.format_number(match.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+        break
+    
+    if phone is None:
         # Pattern for US numbers with parentheses
-        pattern2 = r'$$\d{3}$$[-\s]?\d{3}[-\s]?\d{4}'
-        matches = re.findall(pattern2, text)
+        matches = PHONE_PAREN_RE.findall(text)
         if matches:
             phone = matches[0]
         else:
             # Pattern for simple 10-digit numbers
-            pattern3 = r'\b\d{10}\b'
-            matches = re.findall(pattern3, text)
+            matches = PHONE_10_DIGIT_RE.findall(text)
             if matches:
                 phone = matches[0]
                 # Format as (XXX) XXX-XXXX
@@ -173,21 +702,35 @@ def extract_contact_info(text):
     return email, phone
 
 
+# spaCy pipeline for the NER fallback in extract_name, loaded at most
+# once per process with every component the entity recognizer doesn't
+# need disabled. None until first use; False when spaCy or its model is
+# not installed.
+_NLP = None
+
+def _get_nlp():
+    global _NLP
+    if _NLP is None:
+        if spacy is None:
+            _NLP = False
+        else:
+            try:
+                _NLP = spacy.load("en_core_web_sm",
+                                  disable=["parser", "tagger", "lemmatizer", "attribute_ruler"])
+            except Exception as e:
+                logger.warning(f"spaCy model unavailable, name extraction stays heuristic: {str(e)}")
+                _NLP = False
+    return _NLP or None
+
 def extract_name(text):
     """Extract name from resume text using improved heuristics"""
-    if not text or len(text) < 10:
+    parsed = _parsed(text)
+    if not parsed.raw or len(parsed.raw) < 10:
         logger.warning("Text too short for name extraction")
         return "Unknown"
     
-    # Split text into lines and clean them
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    # Common name patterns
-    name_patterns = [
-        r'^[A-Z][a-z]+ [A-Z][a-z]+$',                      # First Last
-        r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$',              # First M. Last
-        r'^[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+$'           # First Middle Last
-    ]
+    # Name is typically among the first cleaned, non-empty lines
+    lines = parsed.nonempty
     
     # Look at the first few non-empty lines (typically name is at the top)
     for i in range(min(5, len(lines))):
@@ -198,12 +741,12 @@ def extract_name(text):
             continue
         
         # Skip lines that contain typical non-name elements
-        if re.search(r'@|www|\d{3}|resume|cv|curriculum|vitae|address|email|phone|tel|contact', line.lower()):
+        if NAME_SKIP_RE.search(line.lower()):
             continue
         
         # Check if line matches common name patterns
-        for pattern in name_patterns:
-            if re.match(pattern, line):
+        for pattern in NAME_PATTERNS:
+            if pattern.match(line):
                 logger.info(f"Extracted name using pattern match: {line}")
                 return line
         
@@ -215,26 +758,31 @@ def extract_name(text):
             not any(word.isupper() for word in words)):  # Avoid all caps lines
             logger.info(f"Extracted name using heuristic: {line}")
             return line
-    
+
+    # NER fallback when the cheap heuristics find nothing. The name sits
+    # in the header, so only the first 2000 characters go through the
+    # model, and the pipeline itself is loaded once per process.
+    nlp = _get_nlp()
+    if nlp is not None:
+        for ent in nlp(parsed.raw[:2000]).ents:
+            if ent.label_ == 'PERSON':
+                name = ent.text.strip()
+                logger.info(f"Extracted name using NER: {name}")
+                return name
+
     logger.warning("Could not extract name with confidence")
     return "Unknown"
 
 def extract_college(text):
     """Extract college/university name from text"""
-    if not text or len(text) < 10:
+    parsed = _parsed(text)
+    if not parsed.raw or len(parsed.raw) < 10:
         logger.warning("Text too short for education extraction")
         return None
     
-    # List of common education keywords and degree types
-    edu_keywords = [
-        'university', 'college', 'institute', 'school', 'academy', 'polytechnic',
-        'bachelor', 'master', 'phd', 'degree', 'b.tech', 'm.tech', 'b.e.', 'm.e.',
-        'b.sc', 'm.sc', 'b.a.', 'm.a.', 'mba', 'bba', 'education'
-    ]
-    
     # Look for sections that might contain education information
     education_section = None
-    sections = re.split(r'\n\s*\n', text.lower())
+    sections = SECTION_BREAK_RE.split(parsed.lower)
     
     for i, section in enumerate(sections):
         if any(keyword in section for keyword in ['education', 'academic', 'qualification', 'degree']):
@@ -242,12 +790,19 @@ def extract_college(text):
             break
     
     # If education section found, extract from there, otherwise search the whole text
-    search_text = education_section if education_section else text.lower()
+    search_text = education_section if education_section else parsed.lower
     
-    # Look for lines containing education keywords
-    lines = search_text.split('\n')
+    # Look for lines containing education keywords - tokenize each line once
+    # and intersect with the keyword set instead of K substring scans
+    lines = search_text.splitlines()
     for line in lines:
-        if any(keyword in line.lower() for keyword in edu_keywords):
+        # search_text is already lowercased; no per-line copy needed.
+        # Tokens are normalized the same way as the keyword set - trailing
+        # periods dropped ('university.') - and a singular form is also
+        # tried so plurals like 'bachelors' still hit
+        tokens = {t.rstrip('.') for t in EDU_TOKEN_RE.findall(line)}
+        if (_EDU_KEYWORDS_NORM & tokens
+                or _EDU_KEYWORDS_NORM & {t[:-1] for t in tokens if t.endswith('s')}):
             # Extract the full line containing the education keyword
             result = line.strip()
             # Capitalize properly
@@ -260,154 +815,33 @@ def extract_college(text):
 
 def extract_skills(text):
     """Extract skills from resume text with improved matching"""
-    if not text or len(text) < 10:
+    # Plain-string calls are memoized by content - recruiters re-ingest
+    # identical resumes often enough that repeat scans are pure waste
+    if isinstance(text, str):
+        return list(_extract_skills_cached(text))
+    return _extract_skills(text)
+
+@lru_cache(maxsize=1024)
+def _extract_skills_cached(text):
+    """Memoized skills scan keyed on the raw text; returns a tuple so the
+    cached value is immutable and callers get a fresh list"""
+    return tuple(_extract_skills(_parsed(text)))
+
+def _extract_skills(parsed):
+    if not parsed.raw or len(parsed.raw) < 10:
         logger.warning("Text too short for skills extraction")
         return []
     
-    # Common technical skills - expanded list
-    common_skills = [
-        'python', 'java', 'javascript', 'html', 'css', 'react', 'angular', 'vue', 
-        'node.js', 'express', 'django', 'flask', 'spring', 'hibernate', 'sql', 
-        'mysql', 'postgresql', 'mongodb', 'nosql', 'aws', 'azure', 'gcp', 'docker', 
-        'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 'ci/cd', 'agile', 'scrum', 
-        'jira', 'confluence', 'machine learning', 'deep learning', 'ai', 'data science', 
-        'data analysis', 'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'scipy', 
-        'matplotlib', 'tableau', 'power bi', 'excel', 'word', 'powerpoint', 'photoshop', 
-        'illustrator', 'figma', 'sketch', 'ui/ux', 'responsive design', 'mobile development', 
-        'ios', 'android', 'swift', 'kotlin', 'flutter', 'react native', 'c', 'c++', 'c#', 
-        'php', 'ruby', 'rails', 'scala', 'go', 'rust', 'typescript', 'jquery', 'bootstrap', 
-        'tailwind', 'sass', 'less', 'redux', 'graphql', 'rest api', 'soap', 'microservices', 
-        'serverless', 'linux', 'unix', 'windows', 'macos', 'bash', 'powershell', 'networking', 
-        'security', 'penetration testing', 'ethical hacking', 'blockchain', 'cryptocurrency', 
-        'smart contracts', 'solidity', 'web3', 'devops', 'sre', 'cloud computing', 'big data', 
-        'hadoop', 'spark', 'kafka', 'elasticsearch', 'logstash', 'kibana', 'data warehousing', 
-        'etl', 'business intelligence', 'project management', 'leadership', 'communication', 
-        'problem solving', 'critical thinking', 'teamwork', 'time management', 'creativity',
-        'mern', 'mean', 'full stack', 'frontend', 'backend', 'web development', 'mobile app',
-        'database', 'api', 'rest', 'soap', 'json', 'xml', 'http', 'tcp/ip', 'dns', 'ssl',
-        'tls', 'oauth', 'jwt', 'authentication', 'authorization', 'encryption', 'hashing',
-        'testing', 'unit testing', 'integration testing', 'e2e testing', 'qa', 'quality assurance',
-        'debugging', 'performance optimization', 'seo', 'analytics', 'marketing', 'sales',
-        'customer service', 'support', 'helpdesk', 'technical writing', 'documentation',
-        'node', 'npm', 'yarn', 'webpack', 'babel', 'eslint', 'prettier', 'jest', 'mocha', 'chai',
-        'cypress', 'selenium', 'postman', 'swagger', 'openapi', 'firebase', 'supabase', 'amplify',
-        'vercel', 'netlify', 'heroku', 'digital ocean', 'linode', 'ec2', 's3', 'lambda', 'dynamodb',
-        'rds', 'aurora', 'redis', 'memcached', 'nginx', 'apache', 'iis', 'tomcat', 'websocket',
-        'webrtc', 'pwa', 'spa', 'ssr', 'ssg', 'jamstack', 'cms', 'wordpress', 'drupal', 'joomla',
-        'magento', 'shopify', 'woocommerce', 'ecommerce', 'payment gateway', 'stripe', 'paypal',
-        'braintree', 'square', 'authorize.net', 'seo', 'sem', 'smm', 'content marketing', 'email marketing',
-        'affiliate marketing', 'growth hacking', 'a/b testing', 'user research', 'user testing',
-        'usability testing', 'accessibility', 'wcag', 'aria', 'screen reader', 'keyboard navigation',
-        'responsive web design', 'mobile first', 'progressive enhancement', 'graceful degradation',
-        'cross-browser compatibility', 'cross-platform compatibility', 'internationalization', 'localization',
-        'i18n', 'l10n', 'rtl', 'ltr', 'unicode', 'utf-8', 'ascii', 'character encoding', 'emoji',
-        'svg', 'canvas', 'webgl', 'three.js', 'd3.js', 'chart.js', 'highcharts', 'plotly', 'leaflet',
-        'mapbox', 'google maps', 'bing maps', 'openstreetmap', 'geolocation', 'geocoding', 'reverse geocoding',
-        'push notifications', 'service worker', 'web worker', 'indexeddb', 'localstorage', 'sessionstorage',
-        'cookies', 'jwt', 'oauth', 'openid connect', 'saml', 'ldap', 'active directory', 'kerberos',
-        'sso', 'mfa', '2fa', 'biometric authentication', 'facial recognition', 'fingerprint recognition',
-        'voice recognition', 'iris recognition', 'retina recognition', 'palm recognition', 'vein recognition',
-        'behavioral biometrics', 'keystroke dynamics', 'gait analysis', 'signature recognition',
-        'handwriting recognition', 'speech recognition', 'natural language processing', 'nlp',
-        'sentiment analysis', 'entity recognition', 'text classification', 'text summarization',
-        'machine translation', 'speech synthesis', 'text to speech', 'speech to text', 'chatbot',
-        'virtual assistant', 'conversational ai', 'dialog system', 'intent recognition', 'entity extraction',
-        'slot filling', 'context management', 'dialog management', 'dialog flow', 'dialog state tracking',
-        'dialog policy', 'dialog generation', 'dialog evaluation', 'dialog annotation', 'dialog corpus',
-        'dialog dataset', 'dialog system evaluation', 'dialog system annotation', 'dialog system corpus',
-        'dialog system dataset', 'dialog system benchmark', 'dialog system challenge', 'dialog system competition',
-        # HR skills
-        'recruiting', 'talent acquisition', 'onboarding', 'offboarding', 'employee relations',
-        'benefits administration', 'compensation', 'payroll', 'hr policies', 'hr compliance',
-        'performance management', 'succession planning', 'workforce planning', 'employee engagement',
-        'diversity and inclusion', 'training and development', 'organizational development',
-        'change management', 'conflict resolution', 'labor relations', 'collective bargaining',
-        'hris', 'applicant tracking system', 'ats', 'workday', 'sap hr', 'peoplesoft',
-        'oracle hcm', 'bamboo hr', 'greenhouse', 'lever', 'indeed', 'linkedin recruiter',
-        # Finance skills
-        'accounting', 'financial analysis', 'financial reporting', 'budgeting', 'forecasting',
-        'financial planning', 'financial modeling', 'cost accounting', 'tax preparation',
-        'tax planning', 'audit', 'risk assessment', 'compliance', 'sarbanes-oxley', 'sox',
-        'gaap', 'ifrs', 'bookkeeping', 'accounts payable', 'accounts receivable', 'general ledger',
-        'balance sheet', 'income statement', 'cash flow statement', 'financial statements',
-        'quickbooks', 'sap finance', 'oracle financials', 'sage', 'xero', 'excel financial functions',
-        # Marketing skills
-        'digital marketing', 'content marketing', 'social media marketing', 'email marketing',
-        'search engine optimization', 'search engine marketing', 'pay-per-click', 'ppc',
-        'google ads', 'facebook ads', 'instagram ads', 'twitter ads', 'linkedin ads',
-        'conversion rate optimization', 'a/b testing', 'marketing automation', 'customer segmentation',
-        'customer journey mapping', 'brand management', 'product marketing', 'market research',
-        'competitive analysis', 'google analytics', 'adobe analytics', 'hubspot', 'marketo',
-        'mailchimp', 'constant contact', 'hootsuite', 'buffer', 'canva', 'adobe creative suite',
-        # Sales skills
-        'sales strategy', 'sales management', 'account management', 'business development',
-        'lead generation', 'lead qualification', 'cold calling', 'sales presentations',
-        'negotiation', 'closing techniques', 'customer relationship management', 'crm',
-        'salesforce', 'hubspot crm', 'zoho crm', 'pipedrive', 'sales forecasting',
-        'territory management', 'channel sales', 'direct sales', 'inside sales', 'outside sales',
-        # Customer service skills
-        'customer support', 'customer success', 'technical support', 'help desk',
-        'service desk', 'call center', 'customer satisfaction', 'customer retention',
-        'complaint resolution', 'service level agreements', 'sla', 'zendesk', 'freshdesk',
-        'intercom', 'live chat', 'ticketing systems', 'knowledge base management',
-        # Operations skills
-        'operations management', 'supply chain management', 'inventory management',
-        'logistics', 'warehouse management', 'procurement', 'vendor management',
-        'quality control', 'quality assurance', 'process improvement', 'lean', 'six sigma',
-        'kaizen', 'erp systems', 'sap', 'oracle', 'netsuite', 'microsoft dynamics',
-        # Project management skills
-        'project management', 'program management', 'portfolio management', 'agile',
-        'scrum', 'kanban', 'waterfall', 'prince2', 'pmp', 'project planning',
-        'resource allocation', 'risk management', 'stakeholder management',
-        'microsoft project', 'asana', 'trello', 'jira', 'basecamp', 'smartsheet',
-        # Legal skills
-        'contract law', 'corporate law', 'intellectual property', 'patents',
-        'trademarks', 'copyrights', 'compliance', 'regulatory affairs', 'legal research',
-        'legal writing', 'litigation', 'arbitration', 'mediation', 'negotiation',
-        'westlaw', 'lexisnexis', 'docusign', 'e-discovery', 'legal document management',
-        # Healthcare skills
-        'patient care', 'clinical documentation', 'medical coding', 'medical billing',
-        'electronic health records', 'ehr', 'epic', 'cerner', 'meditech', 'allscripts',
-        'hipaa compliance', 'healthcare compliance', 'clinical trials', 'medical research',
-        'telehealth', 'telemedicine', 'healthcare administration', 'healthcare management',
-        # Education skills
-        'curriculum development', 'instructional design', 'e-learning', 'lms',
-        'learning management systems', 'blackboard', 'canvas', 'moodle', 'google classroom',
-        'student assessment', 'educational technology', 'classroom management',
-        'special education', 'iep', 'differentiated instruction', 'student engagement',
-        # Data science skills
-        'data analysis', 'data mining', 'data visualization', 'statistical analysis',
-        'predictive modeling', 'machine learning', 'deep learning', 'natural language processing',
-        'computer vision', 'big data', 'data warehousing', 'etl', 'sql', 'nosql',
-        'r', 'python', 'sas', 'spss', 'stata', 'matlab', 'tableau', 'power bi',
-        'looker', 'qlik', 'd3.js', 'hadoop', 'spark', 'aws redshift', 'google bigquery',
-        'azure synapse', 'snowflake', 'data lake', 'data governance', 'data quality',
-        # Soft skills
-        'communication', 'teamwork', 'leadership', 'problem solving', 'critical thinking',
-        'decision making', 'time management', 'organization', 'adaptability', 'flexibility',
-        'creativity', 'innovation', 'emotional intelligence', 'conflict resolution',
-        'negotiation', 'persuasion', 'presentation skills', 'public speaking',
-        'active listening', 'written communication', 'verbal communication',
-        'interpersonal skills', 'customer service', 'attention to detail',
-        'multitasking', 'work ethic', 'self-motivation', 'resilience', 'stress management'
-    ]
     
     # Try to find a skills section first
     skills_section = None
-    text_lower = text.lower()
-    
-    # Look for a skills section
-    skills_headers = ['skills', 'technical skills', 'core competencies', 'technologies', 'proficiencies']
-    for header in skills_headers:
-        match = re.search(rf'{header}[:\s]*\n', text_lower, re.IGNORECASE)
-        if match:
-            start_idx = match.end()
-            # Find the end of the section (next header or end of text)
-            next_header = re.search(r'\n\s*[a-z\s]+[:\s]*\n', text_lower[start_idx:], re.IGNORECASE)
-            end_idx = start_idx + next_header.start() if next_header else len(text_lower)
-            skills_section = text_lower[start_idx:end_idx]
-            logger.info(f"Found skills section: {len(skills_section)} chars")
-            break
+    text_lower = parsed.lower
+    
+    # Look for a skills section (located by the one-pass header scan)
+    span = parsed.sections.get('skills')
+    if span:
+        skills_section = text_lower[span[0]:span[1]]
+        logger.info(f"Found skills section: {len(skills_section)} chars")
     
     # If skills section found, prioritize extracting from there
     search_text = skills_section if skills_section else text_lower
@@ -415,83 +849,61 @@ def extract_skills(text):
     # Extract skills using different methods
     skills = set()
     
-    # Method 1: Direct matching of common skills
-    for skill in common_skills:
-        # Use word boundary to avoid partial matches
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, search_text, re.IGNORECASE):
-            skills.add(skill)
+    # Method 1: one pass over the text finds every known skill
+    skills |= _scan_skills(search_text)
     
     # Method 2: Look for bullet points or comma-separated lists in skills section
     if skills_section:
-        # Extract bullet points
-        bullet_skills = re.findall(r'[•\-*]\s*([^•\-*\n]+)', skills_section)
-        for skill_text in bullet_skills:
-            skill_text = skill_text.strip().lower()
-            # Check if this matches any known skill
-            for known_skill in common_skills:
-                if known_skill in skill_text:
-                    skills.add(known_skill)
+        # Extract bullet points - one matcher pass per bullet replaces the
+        # old O(|bullets| x |skills|) nested substring scan, and handles
+        # multi-word skills the same way
+        for skill_text in BULLET_ITEM_RE.findall(skills_section):
+            skills |= _scan_skills(skill_text)
         
-        # Extract comma-separated skills
-        comma_lists = re.findall(r'([^•\-*\n:]+(?:,\s*[^,\n]+)+)', skills_section)
-        for skill_list in comma_lists:
+        # Extract comma-separated skills - each item is a single hash lookup
+        for skill_list in COMMA_LIST_RE.findall(skills_section):
             for skill_item in skill_list.split(','):
-                skill_item = skill_item.strip().lower()
+                skill_item = skill_item.strip()
                 # Check if this matches any known skill
-                for known_skill in common_skills:
-                    if known_skill == skill_item:
-                        skills.add(known_skill)
+                if skill_item in COMMON_SKILLS_SET:
+                    skills.add(skill_item)
     
     # Method 3: Look for skills in the entire text if we found few skills
     if len(skills) < 5 and not skills_section:
         # Look for skills mentioned in context
-        skill_contexts = [
-            r'proficient in\s+([^.,:;]+)',
-            r'experience with\s+([^.,:;]+)',
-            r'knowledge of\s+([^.,:;]+)',
-            r'familiar with\s+([^.,:;]+)',
-            r'skilled in\s+([^.,:;]+)',
-            r'worked with\s+([^.,:;]+)',
-            r'expertise in\s+([^.,:;]+)',
-            r'specialized in\s+([^.,:;]+)'
-        ]
-        
-        for context_pattern in skill_contexts:
-            matches = re.findall(context_pattern, text_lower)
+        for context_pattern in SKILL_CONTEXT_RES:
+            matches = context_pattern.findall(text_lower)
             for match in matches:
-                for skill in common_skills:
-                    if skill in match.lower():
-                        skills.add(skill)
+                # matches are substrings of text_lower - already lowercased
+                skills |= _scan_skills(match)
     
     logger.info(f"Extracted {len(skills)} skills")
     return list(skills)
 
 def extract_experience(text):
     """Extract work experience details from resume"""
+    parsed = _parsed(text)
+    text = parsed.raw
     if not text or len(text) < 10:
         logger.warning("Text too short for experience extraction")
         return []
 
+    text_lower = parsed.lower
+
+    # Fast bail-out: a C-level substring probe is far cheaper than running
+    # the structured entry loop on resumes that plainly lack the section
+    if not any(k in text_lower for k in ('experience', 'employment', 'work history')):
+        logger.warning("No clear experience section found")
+        return []
+
     # Look for experience section
     experience_section = None
-    text_lower = text.lower()
-
-    # Common headers for experience sections
-    exp_headers = ['experience', 'work experience', 'professional experience', 'employment history', 'work history']
-
-    # Try to find the experience section
-    for header in exp_headers:
-        match = re.search(rf'{header}[:\s]*\n', text_lower, re.IGNORECASE)
-        if match:
-            start_idx = match.end()
-            # Find the end of the section (next major header or end of text)
-            next_header = re.search(r'\n\s*(?:education|skills|projects|certifications|awards|languages|interests|references)[:\s]*\n', 
-                                   text_lower[start_idx:], re.IGNORECASE)
-            end_idx = start_idx + next_header.start() if next_header else len(text_lower)
-            experience_section = text[start_idx:end_idx]  # Use original case for better analysis
-            logger.info(f"Found experience section: {len(experience_section)} chars")
-            break
+
+    # Located by the one-pass header scan in parse_text
+    span = parsed.sections.get('experience')
+    if span:
+        experience_section = text[span[0]:span[1]]  # Use original case for better analysis
+        logger.info(f"Found experience section: {len(experience_section)} chars")
 
     if not experience_section:
         logger.warning("No clear experience section found")
@@ -500,15 +912,8 @@ def extract_experience(text):
     # Extract job titles, companies, and dates
     experiences = []
 
-    # Common job title patterns
-    job_title_patterns = [
-        r'(senior|junior|lead|principal|staff)?\s*(software|web|mobile|frontend|backend|full stack|devops|cloud|data|machine learning|ai|product|project)?\s*(developer|engineer|architect|manager|designer|analyst|scientist|specialist|consultant)',
-        r'(cto|ceo|cio|vp|director|head|chief)\s*(technology|information|product|engineering|technical|executive|operating)',
-        r'(intern|internship|co-op|trainee|graduate)'
-    ]
-
     # Try to extract structured experience entries
-    lines = experience_section.split('\n')
+    lines = experience_section.splitlines()
     current_exp = {}
 
     for i, line in enumerate(lines):
@@ -516,21 +921,24 @@ def extract_experience(text):
         if not line:
             continue
         
+        # One lowered copy per line, shared by every check below
+        line_lower = line.lower()
+        
         # Check if this line looks like a job title
         is_job_title = False
-        for pattern in job_title_patterns:
-            if re.search(pattern, line.lower()):
+        for pattern in JOB_TITLE_RES:
+            if pattern.search(line_lower):
                 is_job_title = True
                 break
         
         # Check if this line contains a date range
-        has_date = bool(re.search(r'(19|20)\d{2}\s*[-–—to]*\s*((19|20)\d{2}|present|current|now)', line.lower()))
+        has_date = bool(DATE_RANGE_RE.search(line_lower))
         
         # If we find what looks like a new job entry
         if (is_job_title or has_date) and (i == 0 or not lines[i-1].strip()):
             # Save previous entry if it exists
             if current_exp and 'title' in current_exp:
-                experiences.append(current_exp)
+                experiences.append(_finalize_parts(current_exp, 'description'))
                 current_exp = {}
             
             # Start new entry
@@ -541,7 +949,7 @@ def extract_experience(text):
                 next_line = lines[i+1].strip()
                 
                 # Check if next line has dates
-                date_match = re.search(r'(19|20)\d{2}\s*[-–—to]*\s*((19|20)\d{2}|present|current|now)', next_line.lower())
+                date_match = DATE_RANGE_RE.search(next_line.lower())
                 if date_match:
                     current_exp['dates'] = next_line
                     
@@ -556,45 +964,40 @@ def extract_experience(text):
                     # Next line might be company
                     current_exp['company'] = next_line
         
-        # If we're in a current entry, collect description
+        # If we're in a current entry, collect description lines
         elif current_exp and 'title' in current_exp:
-            if 'description' not in current_exp:
-                current_exp['description'] = line
-            else:
-                current_exp['description'] += ' ' + line
+            current_exp.setdefault('description_parts', []).append(line)
 
     # Add the last entry if it exists
     if current_exp and 'title' in current_exp:
-        experiences.append(current_exp)
+        experiences.append(_finalize_parts(current_exp, 'description'))
 
     logger.info(f"Extracted {len(experiences)} experience entries")
     return experiences
 
 def extract_projects(text):
     """Extract project information from resume"""
+    parsed = _parsed(text)
+    text = parsed.raw
     if not text or len(text) < 10:
         logger.warning("Text too short for project extraction")
         return []
 
+    text_lower = parsed.lower
+
+    # Fast bail-out before the structured entry loop
+    if 'project' not in text_lower:
+        logger.warning("No clear projects section found")
+        return []
+
     # Look for projects section
     projects_section = None
-    text_lower = text.lower()
-
-    # Common headers for project sections
-    project_headers = ['projects', 'personal projects', 'academic projects', 'key projects', 'relevant projects']
-
-    # Try to find the projects section
-    for header in project_headers:
-        match = re.search(rf'{header}[:\s]*\n', text_lower, re.IGNORECASE)
-        if match:
-            start_idx = match.end()
-            # Find the end of the section (next major header or end of text)
-            next_header = re.search(r'\n\s*(?:experience|education|skills|certifications|awards|languages|interests|references)[:\s]*\n', 
-                                   text_lower[start_idx:], re.IGNORECASE)
-            end_idx = start_idx + next_header.start() if next_header else len(text_lower)
-            projects_section = text[start_idx:end_idx]  # Use original case for better analysis
-            logger.info(f"Found projects section: {len(projects_section)} chars")
-            break
+
+    # Located by the one-pass header scan in parse_text
+    span = parsed.sections.get('projects')
+    if span:
+        projects_section = text[span[0]:span[1]]  # Use original case for better analysis
+        logger.info(f"Found projects section: {len(projects_section)} chars")
 
     if not projects_section:
         logger.warning("No clear projects section found")
@@ -604,7 +1007,7 @@ def extract_projects(text):
     projects = []
 
     # Try to extract structured project entries
-    lines = projects_section.split('\n')
+    lines = projects_section.splitlines()
     current_project = {}
 
     for i, line in enumerate(lines):
@@ -615,56 +1018,44 @@ def extract_projects(text):
         # Check if this line looks like a project title (typically short, possibly with tech stack in parentheses)
         is_title = (len(line) < 100 and 
                    (i == 0 or not lines[i-1].strip()) and 
-                   not re.match(r'^[•\-*]', line))  # Not a bullet point
+                   not line.startswith(BULLET_CHARS))  # Not a bullet point
         
         if is_title:
             # Save previous project if it exists
             if current_project and 'title' in current_project:
-                projects.append(current_project)
+                projects.append(_finalize_parts(current_project, 'description'))
                 current_project = {}
             
             # Start new project
             current_project = {'title': line}
         
-        # If we're in a current project, collect description
+        # If we're in a current project, collect description lines
         elif current_project and 'title' in current_project:
-            if 'description' not in current_project:
-                current_project['description'] = line
-            else:
-                current_project['description'] += ' ' + line
+            current_project.setdefault('description_parts', []).append(line)
 
     # Add the last project if it exists
     if current_project and 'title' in current_project:
-        projects.append(current_project)
+        projects.append(_finalize_parts(current_project, 'description'))
 
     logger.info(f"Extracted {len(projects)} project entries")
     return projects
 
 def extract_education_details(text):
     """Extract detailed education information from resume"""
+    parsed = _parsed(text)
+    text = parsed.raw
     if not text or len(text) < 10:
         logger.warning("Text too short for education extraction")
         return []
 
     # Look for education section
     education_section = None
-    text_lower = text.lower()
-
-    # Common headers for education sections
-    edu_headers = ['education', 'academic background', 'academic qualifications', 'educational qualifications']
-
-    # Try to find the education section
-    for header in edu_headers:
-        match = re.search(rf'{header}[:\s]*\n', text_lower, re.IGNORECASE)
-        if match:
-            start_idx = match.end()
-            # Find the end of the section (next major header or end of text)
-            next_header = re.search(r'\n\s*(?:experience|skills|projects|certifications|awards|languages|interests|references)[:\s]*\n', 
-                                   text_lower[start_idx:], re.IGNORECASE)
-            end_idx = start_idx + next_header.start() if next_header else len(text_lower)
-            education_section = text[start_idx:end_idx]  # Use original case for better analysis
-            logger.info(f"Found education section: {len(education_section)} chars")
-            break
+
+    # Located by the one-pass header scan in parse_text
+    span = parsed.sections.get('education')
+    if span:
+        education_section = text[span[0]:span[1]]  # Use original case for better analysis
+        logger.info(f"Found education section: {len(education_section)} chars")
 
     if not education_section:
         logger.warning("No clear education section found")
@@ -673,14 +1064,8 @@ def extract_education_details(text):
     # Extract education entries
     education = []
 
-    # Common degree patterns
-    degree_patterns = [
-        r'(bachelor|master|phd|doctorate|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|b\.?tech|m\.?tech|b\.?e\.?|m\.?e\.?|mba)',
-        r'(associate|diploma|certificate)'
-    ]
-
     # Try to extract structured education entries
-    lines = education_section.split('\n')
+    lines = education_section.splitlines()
     current_edu = {}
 
     for i, line in enumerate(lines):
@@ -688,30 +1073,33 @@ def extract_education_details(text):
         if not line:
             continue
         
+        line_lower = line.lower()
+        
         # Check if this line looks like a degree or institution
         is_edu_entry = False
-        for pattern in degree_patterns:
-            if re.search(pattern, line.lower()):
-                is_edu_entry = True
-                break
+        if any(k in line_lower for k in _DEGREE_KEYWORDS):
+            for pattern in DEGREE_RES:
+                if pattern.search(line_lower):
+                    is_edu_entry = True
+                    break
         
         # Also check for institution keywords
         if not is_edu_entry:
-            if re.search(r'(university|college|institute|school|academy)', line.lower()):
+            if any(k in line_lower for k in _INST_KEYWORDS) and INSTITUTION_RE.search(line_lower):
                 is_edu_entry = True
         
         # Check if this line contains a date range
-        has_date = bool(re.search(r'(19|20)\d{2}\s*[-–—to]*\s*((19|20)\d{2}|present|current|now)', line.lower()))
+        has_date = bool(DATE_RANGE_RE.search(line_lower))
         
         # If we find what looks like a new education entry
         if (is_edu_entry or has_date) and (i == 0 or not lines[i-1].strip()):
             # Save previous entry if it exists
             if current_edu and ('institution' in current_edu or 'degree' in current_edu):
-                education.append(current_edu)
+                education.append(_finalize_parts(current_edu, 'details'))
                 current_edu = {}
             
             # Start new entry
-            if re.search(r'(university|college|institute|school|academy)', line.lower()):
+            if any(k in line_lower for k in _INST_KEYWORDS) and INSTITUTION_RE.search(line_lower):
                 current_edu = {'institution': line}
             else:
                 current_edu = {'degree': line}
@@ -719,57 +1107,48 @@ def extract_education_details(text):
             # Try to extract other details from this or next line
             if i + 1 < len(lines) and lines[i+1].strip():
                 next_line = lines[i+1].strip()
+                next_line_lower = next_line.lower()
                 
                 # Check if next line has dates
-                if re.search(r'(19|20)\d{2}\s*[-–—to]*\s*((19|20)\d{2}|present|current|now)', next_line.lower()):
+                if DATE_RANGE_RE.search(next_line_lower):
                     current_edu['dates'] = next_line
-                elif 'institution' not in current_edu and re.search(r'(university|college|institute|school|academy)', next_line.lower()):
+                elif ('institution' not in current_edu
+                      and any(k in next_line_lower for k in _INST_KEYWORDS)
+                      and INSTITUTION_RE.search(next_line_lower)):
                     current_edu['institution'] = next_line
-                elif 'degree' not in current_edu:
-                    for pattern in degree_patterns:
-                        if re.search(pattern, next_line.lower()):
+                elif 'degree' not in current_edu and any(k in next_line_lower for k in _DEGREE_KEYWORDS):
+                    for pattern in DEGREE_RES:
+                        if pattern.search(next_line_lower):
                             current_edu['degree'] = next_line
                             break
         
-        # If we're in a current entry, collect additional details
+        # If we're in a current entry, collect additional detail lines
         elif current_edu and ('institution' in current_edu or 'degree' in current_edu):
-            if 'details' not in current_edu:
-                current_edu['details'] = line
-            else:
-                current_edu['details'] += ' ' + line
+            current_edu.setdefault('details_parts', []).append(line)
 
     # Add the last entry if it exists
     if current_edu and ('institution' in current_edu or 'degree' in current_edu):
-        education.append(current_edu)
+        education.append(_finalize_parts(current_edu, 'details'))
 
     logger.info(f"Extracted {len(education)} education entries")
     return education
 
 def extract_certifications(text):
     """Extract certification information from resume"""
+    parsed = _parsed(text)
+    text = parsed.raw
     if not text or len(text) < 10:
         logger.warning("Text too short for certification extraction")
         return []
 
     # Look for certifications section
     cert_section = None
-    text_lower = text.lower()
-
-    # Common headers for certification sections
-    cert_headers = ['certifications', 'certificates', 'professional certifications', 'credentials']
-
-    # Try to find the certifications section
-    for header in cert_headers:
-        match = re.search(rf'{header}[:\s]*\n', text_lower, re.IGNORECASE)
-        if match:
-            start_idx = match.end()
-            # Find the end of the section (next major header or end of text)
-            next_header = re.search(r'\n\s*(?:experience|education|skills|projects|awards|languages|interests|references)[:\s]*\n', 
-                                   text_lower[start_idx:], re.IGNORECASE)
-            end_idx = start_idx + next_header.start() if next_header else len(text_lower)
-            cert_section = text[start_idx:end_idx]  # Use original case
-            logger.info(f"Found certifications section: {len(cert_section)} chars")
-            break
+
+    # Located by the one-pass header scan in parse_text
+    span = parsed.sections.get('certifications')
+    if span:
+        cert_section = text[span[0]:span[1]]  # Use original case
+        logger.info(f"Found certifications section: {len(cert_section)} chars")
 
     if not cert_section:
         logger.warning("No clear certifications section found")
@@ -779,7 +1158,7 @@ def extract_certifications(text):
     certifications = []
 
     # Try to extract structured certification entries
-    lines = cert_section.split('\n')
+    lines = cert_section.splitlines()
     current_cert = {}
 
     for i, line in enumerate(lines):
@@ -789,52 +1168,52 @@ def extract_certifications(text):
         
         # Check if this line looks like a certification title (typically starts with a bullet or is a short line)
         is_title = (len(line) < 100 and 
-                   (i == 0 or not lines[i-1].strip() or re.match(r'^[•\-*]', line)))
+                   (i == 0 or not lines[i-1].strip() or line.startswith(BULLET_CHARS)))
         
         if is_title:
             # Clean up bullet points if present
-            if re.match(r'^[•\-*]', line):
-                line = re.sub(r'^[•\-*]\s*', '', line)
+            if line.startswith(BULLET_CHARS):
+                line = line.lstrip('\u2022-* \t')
             
             # Save previous certification if it exists
             if current_cert and 'title' in current_cert:
-                certifications.append(current_cert)
+                certifications.append(_finalize_parts(current_cert, 'details'))
                 current_cert = {}
             
             # Start new certification
             current_cert = {'title': line}
             
             # Try to extract date if it's in the same line
-            date_match = re.search(r'(19|20)\d{2}', line)
+            date_match = YEAR_RE.search(line)
             if date_match:
                 current_cert['date'] = date_match.group(0)
         
-        # If we're in a current certification, collect additional details
+        # If we're in a current certification, collect additional detail lines
         elif current_cert and 'title' in current_cert:
-            if 'details' not in current_cert:
-                current_cert['details'] = line
-            else:
-                current_cert['details'] += ' ' + line
+            current_cert.setdefault('details_parts', []).append(line)
 
     # Add the last certification if it exists
     if current_cert and 'title' in current_cert:
-        certifications.append(current_cert)
+        certifications.append(_finalize_parts(current_cert, 'details'))
 
     logger.info(f"Extracted {len(certifications)} certification entries")
     return certifications
 
 def preprocess_text(text):
     """Preprocess text to focus on important terms"""
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove punctuation
-    text = re.sub(r'[^\w\s]', ' ', text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    return text
+    # Lowercase, map punctuation to spaces through the C-level table, and
+    # let split/join collapse runs of whitespace and strip the ends
+    return ' '.join(text.lower().translate(_PUNCT_TABLE).split())
+
+@lru_cache(maxsize=256)
+def _job_vectorizer(job_processed):
+    """Vectorizer fitted once per distinct job text, with the job's own
+    TF-IDF vector precomputed. Scoring a batch of resumes against the same
+    job then only pays one transform per resume instead of a vocabulary
+    rebuild per pair"""
+    vectorizer = TfidfVectorizer(stop_words='english')
+    jd_vec = vectorizer.fit_transform([job_processed])
+    return vectorizer, jd_vec
 
 def calculate_semantic_similarity(resume_text, job_text):
     """Calculate semantic similarity between resume and job description using TF-IDF and cosine similarity"""
@@ -846,12 +1225,14 @@ def calculate_semantic_similarity(resume_text, job_text):
         resume_processed = preprocess_text(resume_text)
         job_processed = preprocess_text(job_text)
         
-        # Create TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(stop_words='english')
-        tfidf_matrix = vectorizer.fit_transform([resume_processed, job_processed])
+        # Fit is cached per job; only the resume is vectorized here
+        vectorizer, jd_vec = _job_vectorizer(job_processed)
+        resume_vec = vectorizer.transform([resume_processed])
         
-        # Calculate cosine similarity
-        similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+        # Both vectors come out of TfidfVectorizer L2-normalized, so the
+        # cosine is just their sparse dot product - no sklearn validation
+        # or shape bookkeeping on the per-resume path
+        similarity = (resume_vec @ jd_vec.T)[0, 0]
         
         logger.info(f"Semantic similarity score: {similarity:.4f}")
         return similarity
@@ -859,133 +1240,164 @@ def calculate_semantic_similarity(resume_text, job_text):
         logger.error(f"Error calculating semantic similarity: {str(e)}")
         return 0.0
 
+def _batch_semantic_similarity(resume_texts, job_text):
+    """Similarity of every resume in a batch against one job via a single
+    transform and sparse matmul; output order matches the input"""
+    if not resume_texts:
+        return []
+    if not job_text:
+        return [0.0] * len(resume_texts)
+    try:
+        vectorizer, jd_vec = _job_vectorizer(preprocess_text(job_text))
+        matrix = vectorizer.transform([preprocess_text(r) for r in resume_texts])
+        return (matrix @ jd_vec.T).toarray().ravel().tolist()
+    except Exception as e:
+        logger.error(f"Error calculating batch semantic similarity: {str(e)}")
+        return [0.0] * len(resume_texts)
+
 def calculate_skills_match_score(resume_skills, required_skills):
     """Calculate a score based on matching skills"""
     if not required_skills:
         logger.warning("No required skills specified for job")
         return 0.0, []
     
-    # Filter out empty strings from required skills
-    required_skills = [s for s in required_skills if s]
-    if not required_skills:
+    # Case-insensitive matching; one set comprehension also drops empty
+    # strings, and turns the per-skill list scan into a hash lookup
+    required_lower = {s.lower() for s in required_skills if s}
+    if not required_lower:
         return 0.0, []
     
-    # Case-insensitive matching
-    required_lower = [s.lower() for s in required_skills]
-    
     # Check for exact matches
-    matched_skills = []
-    for skill in resume_skills:
-        if skill.lower() in required_lower:
-            matched_skills.append(skill)
+    matched_skills = [skill for skill in resume_skills if skill.lower() in required_lower]
     
     # Calculate skills match ratio
-    skills_match_ratio = len(matched_skills) / len(required_skills)
+    skills_match_ratio = len(matched_skills) / len(required_lower)
     
     # Bonus for having most of the required skills
     if skills_match_ratio >= 0.7:
         skills_match_ratio = min(1.0, skills_match_ratio + 0.1)  # Bonus for having most required skills
     
-    logger.info(f"Skills match: {len(matched_skills)}/{len(required_skills)} = {skills_match_ratio:.4f}")
+    logger.info(f"Skills match: {len(matched_skills)}/{len(required_lower)} = {skills_match_ratio:.4f}")
     
     return skills_match_ratio, matched_skills
 
-def calculate_experience_relevance(resume_experiences, job_text):
-    """Calculate how relevant the candidate's experience is to the job"""
-    if not resume_experiences or not job_text:
+@lru_cache(maxsize=256)
+def _job_terms(job_text_lower):
+    """Significant-term set for a job description, tokenized once and
+    reused by every relevance check and every resume scored against the
+    same job"""
+    # Set membership against the cached frozenset - stopwords.words()
+    # rebuilds a fresh list on every call
+    return frozenset(term for term in WORD_RE.findall(job_text_lower)
+                     if len(term) > 3 and term not in STOPWORDS)
+
+def calculate_experience_relevance(resume_experiences, job_terms):
+    """Calculate how relevant the candidate's experience is to the job,
+    given the job's pre-tokenized significant-term set"""
+    if not resume_experiences or not job_terms:
         return 0.0
 
-    job_text_lower = job_text.lower()
-
-    # Extract key terms from job description
-    job_terms = set(re.findall(r'\b\w+\b', job_text_lower))
-    job_terms = {term for term in job_terms if len(term) > 3 and term not in stopwords.words('english')}
-
     # Calculate relevance for each experience entry
     relevance_scores = []
+    n_job_terms = len(job_terms)  # non-zero per the guard above
 
     for exp in resume_experiences:
         if 'description' not in exp:
             continue
         
-        exp_text = exp.get('title', '') + ' ' + exp.get('company', '') + ' ' + exp.get('description', '')
+        exp_text = ' '.join((exp.get('title', ''), exp.get('company', ''), exp.get('description', '')))
         exp_text_lower = exp_text.lower()
         
-        # Count matching terms
-        exp_terms = set(re.findall(r'\b\w+\b', exp_text_lower))
-        exp_terms = {term for term in exp_terms if len(term) > 3 and term not in stopwords.words('english')}
+        exp_terms = {term for term in WORD_RE.findall(exp_text_lower)
+                     if len(term) > 3 and term not in STOPWORDS}
         
-        matching_terms = job_terms.intersection(exp_terms)
-        
-        # Calculate relevance score for this experience
-        if len(job_terms) > 0:
-            relevance = len(matching_terms) / len(job_terms)
-            relevance_scores.append(relevance)
+        # Count matching terms - set & walks the smaller operand, and only
+        # the size of the overlap is needed
+        relevance_scores.append(len(job_terms & exp_terms) / n_job_terms)
 
     # Return average relevance across all experiences
     if relevance_scores:
         return sum(relevance_scores) / len(relevance_scores)
     return 0.0
 
-def calculate_project_relevance(resume_projects, job_text):
-    """Calculate how relevant the candidate's projects are to the job"""
-    if not resume_projects or not job_text:
+def calculate_project_relevance(resume_projects, job_terms):
+    """Calculate how relevant the candidate's projects are to the job,
+    given the job's pre-tokenized significant-term set"""
+    if not resume_projects or not job_terms:
         return 0.0
 
-    job_text_lower = job_text.lower()
-
-    # Extract key terms from job description
-    job_terms = set(re.findall(r'\b\w+\b', job_text_lower))
-    job_terms = {term for term in job_terms if len(term) > 3 and term not in stopwords.words('english')}
-
     # Calculate relevance for each project entry
     relevance_scores = []
+    n_job_terms = len(job_terms)  # non-zero per the guard above
 
     for project in resume_projects:
         if 'description' not in project:
             continue
         
-        project_text = project.get('title', '') + ' ' + project.get('description', '')
+        project_text = ' '.join((project.get('title', ''), project.get('description', '')))
         project_text_lower = project_text.lower()
         
-        # Count matching terms
-        project_terms = set(re.findall(r'\b\w+\b', project_text_lower))
-        project_terms = {term for term in project_terms if len(term) > 3 and term not in stopwords.words('english')}
-        
-        matching_terms = job_terms.intersection(project_terms)
+        project_terms = {term for term in WORD_RE.findall(project_text_lower)
+                         if len(term) > 3 and term not in STOPWORDS}
         
-        # Calculate relevance score for this project
-        if len(job_terms) > 0:
-            relevance = len(matching_terms) / len(job_terms)
-            relevance_scores.append(relevance)
+        # Count matching terms - set & walks the smaller operand
+        relevance_scores.append(len(job_terms & project_terms) / n_job_terms)
 
     # Return average relevance across all projects
     if relevance_scores:
         return sum(relevance_scores) / len(relevance_scores)
     return 0.0
 
-def calculate_education_relevance(resume_education, job_text):
-    """Calculate how relevant the candidate's education is to the job"""
-    if not resume_education or not job_text:
-        return 0.0
+# Education/certification keyword vocabularies, compiled into single
+# alternations so each text needs one scan instead of one substring test
+# per keyword. Longest-first ordering makes phrases like 'computer
+# science' win over their single-word members.
+def _keyword_re(keywords):
+    return re_fast.compile(
+        r'\b(?:' + '|'.join(sorted(map(re.escape, keywords), key=len, reverse=True)) + r')\b'
+    )
 
+EDU_KEYWORD_RE = _keyword_re([
+    'degree', 'bachelor', 'master', 'phd', 'doctorate', 'bs', 'ms', 'ba', 'ma',
+    'btech', 'mtech', 'be', 'me', 'mba', 'education', 'university', 'college',
+    'academic', 'graduate', 'undergraduate', 'major', 'minor', 'concentration',
+    'computer science', 'engineering', 'information technology', 'it', 'business',
+    'management', 'marketing', 'finance', 'accounting', 'economics', 'mathematics',
+    'statistics', 'data science', 'machine learning', 'artificial intelligence'
+])
+
+CERT_KEYWORD_RE = _keyword_re([
+    'certification', 'certificate', 'certified', 'credential', 'license',
+    'aws', 'azure', 'gcp', 'google cloud', 'microsoft', 'oracle', 'cisco',
+    'comptia', 'pmp', 'scrum', 'agile', 'itil', 'security', 'network',
+    'cloud', 'data', 'ai', 'machine learning', 'web', 'mobile', 'development'
+])
+
+# All job-side derived features bundled behind one cache entry, so a job
+# screened across several upload batches pays for tokenization, keyword
+# extraction and the TF-IDF fit exactly once
+JobIndex = namedtuple('JobIndex', ['terms', 'edu_terms', 'cert_terms', 'vectorizer', 'jd_vec'])
+
+@lru_cache(maxsize=128)
+def _job_index(job_text):
+    """Build every derived feature of a job text once: significant terms,
+    education/certification keyword sets, and the fitted vectorizer with
+    the job's own TF-IDF vector"""
     job_text_lower = job_text.lower()
+    vectorizer, jd_vec = _job_vectorizer(preprocess_text(job_text))
+    return JobIndex(
+        terms=_job_terms(job_text_lower),
+        edu_terms=frozenset(EDU_KEYWORD_RE.findall(job_text_lower)),
+        cert_terms=frozenset(CERT_KEYWORD_RE.findall(job_text_lower)),
+        vectorizer=vectorizer,
+        jd_vec=jd_vec,
+    )
 
-    # Extract education-related terms from job description
-    edu_keywords = [
-        'degree', 'bachelor', 'master', 'phd', 'doctorate', 'bs', 'ms', 'ba', 'ma',
-        'btech', 'mtech', 'be', 'me', 'mba', 'education', 'university', 'college',
-        'academic', 'graduate', 'undergraduate', 'major', 'minor', 'concentration',
-        'computer science', 'engineering', 'information technology', 'it', 'business',
-        'management', 'marketing', 'finance', 'accounting', 'economics', 'mathematics',
-        'statistics', 'data science', 'machine learning', 'artificial intelligence'
-    ]
-
-    # Check if job requires specific education
-    required_edu_terms = []
-    for term in edu_keywords:
-        if term in job_text_lower:
-            required_edu_terms.append(term)
+def calculate_education_relevance(resume_education, required_edu_terms):
+    """Calculate how relevant the candidate's education is to the job,
+    given the job's pre-extracted education keyword set"""
+    if not resume_education:
+        return 0.0
 
     if not required_edu_terms:
         # If job doesn't specify education requirements, give a neutral score
@@ -993,6 +1405,7 @@ def calculate_education_relevance(resume_education, job_text):
 
     # Calculate relevance for each education entry
     relevance_scores = []
+    n_required = len(required_edu_terms)
 
     for edu in resume_education:
         edu_text = ' '.join([
@@ -1000,105 +1413,115 @@ def calculate_education_relevance(resume_education, job_text):
             edu.get('degree', ''),
             edu.get('details', '')
         ]).lower()
-        
-        # Count matching terms
-        matches = sum(1 for term in required_edu_terms if term in edu_text)
-        
-        # Calculate relevance score for this education entry
-        if len(required_edu_terms) > 0:
-            relevance = matches / len(required_edu_terms)
-            relevance_scores.append(relevance)
+
+        # One pass over the entry, then a set intersection
+        matches = len(required_edu_terms & set(EDU_KEYWORD_RE.findall(edu_text)))
+        relevance_scores.append(matches / n_required)
 
     # Return highest education relevance (most relevant degree)
     if relevance_scores:
         return max(relevance_scores)
     return 0.0
 
-def calculate_certification_relevance(resume_certifications, job_text):
-    """Calculate how relevant the candidate's certifications are to the job"""
-    if not resume_certifications or not job_text:
+def calculate_certification_relevance(resume_certifications, required_cert_terms):
+    """Calculate how relevant the candidate's certifications are to the
+    job, given the job's pre-extracted certification keyword set"""
+    if not resume_certifications:
         return 0.0
 
-    job_text_lower = job_text.lower()
-
-    # Extract certification-related terms from job description
-    cert_keywords = [
-        'certification', 'certificate', 'certified', 'credential', 'license',
-        'aws', 'azure', 'gcp', 'google cloud', 'microsoft', 'oracle', 'cisco',
-        'comptia', 'pmp', 'scrum', 'agile', 'itil', 'security', 'network',
-        'cloud', 'data', 'ai', 'machine learning', 'web', 'mobile', 'development'
-    ]
-
-    # Check if job mentions certifications
-    required_cert_terms = []
-    for term in cert_keywords:
-        if term in job_text_lower:
-            required_cert_terms.append(term)
-
     if not required_cert_terms:
         # If job doesn't specify certification requirements, give a neutral score
         return 0.5
 
     # Calculate relevance for each certification entry
     relevance_scores = []
+    n_required = len(required_cert_terms)
 
     for cert in resume_certifications:
         cert_text = ' '.join([
             cert.get('title', ''),
             cert.get('details', '')
         ]).lower()
-        
-        # Count matching terms
-        matches = sum(1 for term in required_cert_terms if term in cert_text)
-        
-        # Calculate relevance score for this certification entry
-        if len(required_cert_terms) > 0:
-            relevance = matches / len(required_cert_terms)
-            relevance_scores.append(relevance)
+
+        # One pass over the entry, then a set intersection
+        matches = len(required_cert_terms & set(CERT_KEYWORD_RE.findall(cert_text)))
+        relevance_scores.append(matches / n_required)
 
     # Return highest certification relevance (most relevant certification)
     if relevance_scores:
         return max(relevance_scores)
     return 0.0
 
-def calculate_comprehensive_ats_score(resume_text, job_description, job_requirements, required_skills):
+def calculate_comprehensive_ats_score(resume_text, job_description, job_requirements, required_skills,
+                                      semantic_similarity=None):
     """Calculate a comprehensive ATS score that truly compares the entire resume against all job details"""
     if not resume_text or not job_description:
         logger.warning("Missing text for score calculation")
         return 0, [], [], {}
-    
-    # Extract all components from resume
-    resume_skills = extract_skills(resume_text)
-    resume_experiences = extract_experience(resume_text)
-    resume_projects = extract_projects(resume_text)
-    resume_education = extract_education_details(resume_text)
-    resume_certifications = extract_certifications(resume_text)
-    
+
+    # Combine job description and requirements for text analysis; every
+    # job-side derived feature comes out of one cache entry shared across
+    # resumes and upload batches
+    job_text = job_description + " " + job_requirements
+
+    # A job with no required skills and barely any text gives every
+    # component nothing to match against - skip the whole pipeline
+    if not required_skills and len(job_text) < 200:
+        logger.warning("Job posting has no skills and too little text to score against")
+        return 0, [], [], {
+            "skills_match": 0,
+            "semantic_similarity": 0,
+            "experience_relevance": 0,
+            "project_relevance": 0,
+            "education_relevance": 0,
+            "certification_relevance": 0,
+            "total_score": 0
+        }
+
+    # Extract components from the resume, tokenizing the text exactly
+    # once. Severely truncated resumes can't contain real experience or
+    # education sections - skip those extractors and score only on
+    # skills + semantic similarity
+    parsed = parse_text(resume_text)
+    resume_skills = extract_skills(parsed)
+    if len(resume_text) >= 200:
+        resume_experiences = extract_experience(parsed)
+        resume_projects = extract_projects(parsed)
+        resume_education = extract_education_details(parsed)
+        resume_certifications = extract_certifications(parsed)
+    else:
+        logger.warning(f"Resume text too short for section extraction: {len(resume_text)} chars")
+        resume_experiences = []
+        resume_projects = []
+        resume_education = []
+        resume_certifications = []
+
     logger.info(f"Extracted from resume: {len(resume_skills)} skills, {len(resume_experiences)} experiences, "
                 f"{len(resume_projects)} projects, {len(resume_education)} education entries, "
                 f"{len(resume_certifications)} certifications")
-    
-    # Combine job description and requirements for text analysis
-    job_text = job_description + " " + job_requirements
+
+    job_index = _job_index(job_text)
     
     # 1. Skills Match Score 
     skills_match_ratio, matched_skills = calculate_skills_match_score(resume_skills, required_skills)
     
     # 2. Semantic Similarity Score
-    # This compares the entire resume text against the entire job text
-    semantic_similarity = calculate_semantic_similarity(resume_text, job_text)
-    
-    # 3. Experience Relevance 
-    experience_relevance = calculate_experience_relevance(resume_experiences, job_text)
-    
-    # 4. Project Relevance 
-    project_relevance = calculate_project_relevance(resume_projects, job_text)
+    # This compares the entire resume text against the entire job text;
+    # batch callers pass the value precomputed by the fused TF-IDF pass
+    if semantic_similarity is None:
+        semantic_similarity = calculate_semantic_similarity(resume_text, job_text)
     
+    # 3. Experience Relevance
+    experience_relevance = calculate_experience_relevance(resume_experiences, job_index.terms)
+
+    # 4. Project Relevance
+    project_relevance = calculate_project_relevance(resume_projects, job_index.terms)
+
     # 5. Education Relevance
-    education_relevance = calculate_education_relevance(resume_education, job_text)
-    
+    education_relevance = calculate_education_relevance(resume_education, job_index.edu_terms)
+
     # 6. Certification Relevance
-    certification_relevance = calculate_certification_relevance(resume_certifications, job_text)
+    certification_relevance = calculate_certification_relevance(resume_certifications, job_index.cert_terms)
     
     # Calculate final score with component weights
     final_score = (
@@ -1170,8 +1593,9 @@ def jobs():
         limit = request.args.get('limit', type=int)
         skip = request.args.get('skip', type=int, default=0)
         jobs = JobRole.get_all(db, limit, skip)
-        # Serialize the jobs before returning
-        serialized_jobs = serialize_doc(jobs)
+        # Serialize document-by-document while draining the cursor so the
+        # raw BSON docs are never held in memory all at once
+        serialized_jobs = [serialize_doc(job) for job in jobs]
         return jsonify({"jobs": serialized_jobs})
 
 @bp.route('/jobs/<job_id>', methods=['GET', 'PUT', 'DELETE'])
@@ -1236,104 +1660,113 @@ def upload_resumes():
     
     results = []
     
+    # Read each upload into memory once and hand the bytes straight to the
+    # process pool - no temp-file write + re-read round-trip per resume
+    staged = []  # (filename, raw bytes)
     for file in files:
         if file and allowed_file(file.filename):
             filename = secure_filename(file.filename)
             logger.info(f"Processing file: {filename}")
+            staged.append((filename, file.read()))
+    
+    parsed_files = list(_get_executor().map(_parse_one, staged))
+    
+    # Job-side values used for every result in the batch - look them up
+    # and build the ObjectId once instead of once per file
+    job_oid = ObjectId(job_id)
+    job_title = job['title']
+    job_description = job.get('description', '')
+    job_requirements = job.get('requirements', '')
+    job_skills = job.get('skills', [])
+
+    # One fused TF-IDF pass covers the whole batch: a single transform of
+    # all resume texts and one sparse matmul against the job vector,
+    # instead of a separate vectorization per resume
+    job_text = job_description + " " + job_requirements
+    similarities = _batch_semantic_similarity(
+        [parsed.get("text", "") for parsed in parsed_files], job_text
+    )
+    
+    for (filename, _), parsed, similarity in zip(staged, parsed_files, similarities):
+        try:
+            if "error" in parsed:
+                raise RuntimeError(parsed["error"])
             
-            # Save file to temporary location
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{filename.split('.')[-1]}") as temp:
-                file.save(temp.name)
-                file_path = temp.name
+            resume_text = parsed["text"]
             
-            try:
-                # Extract text from file
-                resume_text = extract_text(file_path)
-                
-                # Log the text extraction result
-                if resume_text:
-                    logger.info(f"Successfully extracted {len(resume_text)} characters from {filename}")
-                else:
-                    logger.warning(f"Failed to extract text from {filename}")
-                
-                if not resume_text or len(resume_text) < 50:
-                    logger.warning(f"Extracted text is too short or empty: {len(resume_text) if resume_text else 0} chars")
-                    # Add a basic result with minimal information
-                    result = {
-                        "name": "Unknown",
-                        "email": None,
-                        "phone": None,
-                        "college": None,
-                        "jobId": ObjectId(job_id),
-                        "jobTitle": job['title'],
-                        "skills": [],
-                        "matchedSkills": [],
-                        "score": 0,
-                        "batchId": batch_id,
-                        "filename": filename,
-                        "processed": True,
-                        "processingError": "Could not extract text from resume"
-                    }
-                else:
-                    # Extract information
-                    name = extract_name(resume_text)
-                    email, phone = extract_contact_info(resume_text)
-                    college = extract_college(resume_text)
-                    
-                    # Calculate comprehensive score
-                    score, skills, matched_skills, score_breakdown = calculate_comprehensive_ats_score(
-                        resume_text, 
-                        job.get('description', ''), 
-                        job.get('requirements', ''), 
-                        job.get('skills', [])
-                    )
-                    
-                    # Create result object
-                    result = {
-                        "name": name,
-                        "email": email,
-                        "phone": phone,
-                        "college": college,
-                        "jobId": ObjectId(job_id),
-                        "jobTitle": job['title'],
-                        "skills": skills,
-                        "matchedSkills": matched_skills,
-                        "score": score,
-                        "scoreBreakdown": score_breakdown,
-                        "batchId": batch_id,
-                        "filename": filename,
-                        "processed": True
-                    }
-                
-                results.append(result)
-                logger.info(f"Successfully processed {filename}, score: {result['score']}")
+            # Log the text extraction result
+            if resume_text:
+                logger.info(f"Successfully extracted {len(resume_text)} characters from {filename}")
+            else:
+                logger.warning(f"Failed to extract text from {filename}")
             
-            except Exception as e:
-                logger.error(f"Error processing file {filename}: {str(e)}")
-                logger.error(traceback.format_exc())
-                # Add a result with error information
-                results.append({
-                    "name": "Error",
+            if not resume_text or len(resume_text) < 50:
+                logger.warning(f"Extracted text is too short or empty: {len(resume_text)} chars")
+                # Add a basic result with minimal information
+                result = {
+                    "name": "Unknown",
                     "email": None,
                     "phone": None,
                     "college": None,
-                    "jobId": ObjectId(job_id),
-                    "jobTitle": job['title'],
+                    "jobId": job_oid,
+                    "jobTitle": job_title,
                     "skills": [],
                     "matchedSkills": [],
                     "score": 0,
                     "batchId": batch_id,
                     "filename": filename,
-                    "processed": False,
-                    "processingError": str(e)
-                })
+                    "processed": True,
+                    "processingError": "Could not extract text from resume"
+                }
+            else:
+                # Calculate comprehensive score
+                score, skills, matched_skills, score_breakdown = calculate_comprehensive_ats_score(
+                    resume_text,
+                    job_description,
+                    job_requirements,
+                    job_skills,
+                    semantic_similarity=similarity
+                )
+                
+                # Create result object
+                result = {
+                    "name": parsed["name"],
+                    "email": parsed["email"],
+                    "phone": parsed["phone"],
+                    "college": parsed["college"],
+                    "jobId": job_oid,
+                    "jobTitle": job_title,
+                    "skills": skills,
+                    "matchedSkills": matched_skills,
+                    "score": score,
+                    "scoreBreakdown": score_breakdown,
+                    "batchId": batch_id,
+                    "filename": filename,
+                    "processed": True
+                }
             
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(file_path)
-                except Exception as e:
-                    logger.error(f"Error removing temp file: {str(e)}")
+            results.append(result)
+            logger.info(f"Successfully processed {filename}, score: {result['score']}")
+        
+        except Exception as e:
+            logger.error(f"Error processing file {filename}: {str(e)}")
+            logger.error(parsed.get("traceback") or traceback.format_exc())
+            # Add a result with error information
+            results.append({
+                "name": "Error",
+                "email": None,
+                "phone": None,
+                "college": None,
+                "jobId": job_oid,
+                "jobTitle": job_title,
+                "skills": [],
+                "matchedSkills": [],
+                "score": 0,
+                "batchId": batch_id,
+                "filename": filename,
+                "processed": False,
+                "processingError": str(e)
+            })
     
     # Save results to database
     if results:
@@ -1371,14 +1804,20 @@ def get_results():
     if search:
         filters['search'] = search
     
-    # Get results
+    # Get results - only the fields the results table renders; the heavy
+    # scoreBreakdown is served on demand by /score-breakdown/<id>
     results, total = ResumeResult.get_all(
-        db, 
+        db,
         filters=filters,
         sort_by=sort_by,
         sort_order=sort_order,
         page=page,
-        limit=limit
+        limit=limit,
+        projection={
+            "name": 1, "email": 1, "phone": 1, "college": 1, "score": 1,
+            "jobId": 1, "jobTitle": 1, "skills": 1, "matchedSkills": 1,
+            "batchId": 1, "filename": 1, "processed": 1, "createdAt": 1
+        }
     )
     
     # Serialize results before returning
@@ -1392,6 +1831,20 @@ def get_results():
         "pages": (total + limit - 1) // limit
     })
 
+@bp.route('/results', methods=['PATCH'])
+def update_results():
+    """Apply partial updates to multiple resume results in one round-trip"""
+    db = current_app.config["db"]
+
+    updates = request.json
+    if not isinstance(updates, list) or not all(
+        isinstance(doc, dict) and doc.get('_id') for doc in updates
+    ):
+        return jsonify({"error": "Expected a list of update documents with _id"}), 400
+
+    updated = ResumeResult.bulk_upsert(db, updates)
+    return jsonify({"success": True, "updated": updated})
+
 @bp.route('/stats', methods=['GET'])
 def get_stats():
     db = current_app.config["db"]
@@ -1417,15 +1870,19 @@ def get_score_breakdown(result_id):
     result = ResumeResult.get_by_id(db, result_id)
     if not result:
         return jsonify({"error": "Result not found"}), 404
-    
-    # Check if score breakdown exists
-    if 'scoreBreakdown' not in result:
+
+    # Check if score breakdown exists before doing any serialization work
+    breakdown = result.pop('scoreBreakdown', None)
+    if not breakdown:
         return jsonify({"error": "Score breakdown not available for this result"}), 404
-    
-    # Serialize the result before returning
+
+    # The breakdown is written as plain ints at scoring time, so it is
+    # JSON-ready exactly as stored; detach it so serialize_doc only walks
+    # the fields that can actually hold ObjectIds/datetimes
     serialized_result = serialize_doc(result)
-    
+    serialized_result['scoreBreakdown'] = breakdown
+
     return jsonify({
         "result": serialized_result,
-        "scoreBreakdown": serialized_result.get('scoreBreakdown')
+        "scoreBreakdown": breakdown
     })
\ No newline at end of file
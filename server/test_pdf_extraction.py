@@ -1,8 +1,12 @@
 import os
 import sys
+import glob
 import logging
 import argparse
-from improved_routes import extract_text_from_pdf, extract_text_from_docx, extract_name, extract_contact_info, extract_skills
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from routes import (extract_text_from_pdf, extract_text_from_docx, extract_header_text,
+                    extract_name, extract_contact_info, extract_skills, parse_text)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
@@ -10,82 +14,151 @@ logging.basicConfig(level=logging.INFO,
                     handlers=[logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
+# C-level lookup table for flattening previews onto one log line
+_NL_TABLE = str.maketrans({'\n': ' ', '\r': ' '})
+
 def test_pdf_extraction(file_path):
     """Test PDF text extraction and information parsing"""
-    logger.info(f"Testing PDF extraction on: {file_path}")
-    
+    logger.info("Testing PDF extraction on: %s", file_path)
+
     # Extract text
     text = extract_text_from_pdf(file_path)
-    
+
     if not text:
         logger.error("Failed to extract any text from the PDF")
         return False
-    
-    logger.info(f"Successfully extracted {len(text)} characters")
-    logger.info(f"Text preview: {text[:200].replace(chr(10), ' ')}...")
-    
-    # Extract information
-    name = extract_name(text)
+
+    # Lazy %-formatting plus the isEnabledFor guard keep preview slicing
+    # and list joining off the hot path when INFO is disabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Successfully extracted %d characters", len(text))
+        logger.info("Text preview: %s...", text[:200].translate(_NL_TABLE))
+
+    # Extract information - tokenize/lower the text once and share the
+    # parsed view across the extractors instead of re-materializing it
+    parsed = parse_text(text)
+    name = extract_name(parsed)
     email, phone = extract_contact_info(text)
-    skills = extract_skills(text)
-    
+    skills = extract_skills(parsed)
+
     # Print results
-    logger.info(f"Extracted Name: {name}")
-    logger.info(f"Extracted Email: {email}")
-    logger.info(f"Extracted Phone: {phone}")
-    logger.info(f"Extracted Skills: {', '.join(skills)}")
-    
+    logger.info("Extracted Name: %s", name)
+    logger.info("Extracted Email: %s", email)
+    logger.info("Extracted Phone: %s", phone)
+    logger.info("Extracted Skills: %s", skills)
+
     return True
 
 def test_docx_extraction(file_path):
     """Test DOCX text extraction and information parsing"""
-    logger.info(f"Testing DOCX extraction on: {file_path}")
-    
+    logger.info("Testing DOCX extraction on: %s", file_path)
+
     # Extract text
     text = extract_text_from_docx(file_path)
-    
+
     if not text:
         logger.error("Failed to extract any text from the DOCX")
         return False
-    
-    logger.info(f"Successfully extracted {len(text)} characters")
-    logger.info(f"Text preview: {text[:200].replace(chr(10), ' ')}...")
-    
-    # Extract information
-    name = extract_name(text)
+
+    # Lazy %-formatting plus the isEnabledFor guard keep preview slicing
+    # and list joining off the hot path when INFO is disabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Successfully extracted %d characters", len(text))
+        logger.info("Text preview: %s...", text[:200].translate(_NL_TABLE))
+
+    # Extract information - tokenize/lower the text once and share the
+    # parsed view across the extractors instead of re-materializing it
+    parsed = parse_text(text)
+    name = extract_name(parsed)
     email, phone = extract_contact_info(text)
-    skills = extract_skills(text)
-    
+    skills = extract_skills(parsed)
+
     # Print results
-    logger.info(f"Extracted Name: {name}")
-    logger.info(f"Extracted Email: {email}")
-    logger.info(f"Extracted Phone: {phone}")
-    logger.info(f"Extracted Skills: {', '.join(skills)}")
-    
+    logger.info("Extracted Name: %s", name)
+    logger.info("Extracted Email: %s", email)
+    logger.info("Extracted Phone: %s", phone)
+    logger.info("Extracted Skills: %s", skills)
+
     return True
 
+def test_contact_extraction(file_path):
+    """Test the header-only fast path: name and contact info without
+    decoding the whole document"""
+    logger.info("Testing header extraction on: %s", file_path)
+
+    text = extract_header_text(file_path)
+
+    if not text:
+        logger.error("Failed to extract header text from the PDF")
+        return False
+
+    name = extract_name(text)
+    email, phone = extract_contact_info(text)
+
+    logger.info("Extracted Name: %s", name)
+    logger.info("Extracted Email: %s", email)
+    logger.info("Extracted Phone: %s", phone)
+
+    return True
+
+# Suffix-keyed dispatch - adding a format means one entry here instead of
+# another elif branch
+EXTRACTORS = {
+    '.pdf': test_pdf_extraction,
+    '.docx': test_docx_extraction,
+}
+
+def process_one(file_path, contact_only=False):
+    """Run the extraction test appropriate for one file"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if contact_only and ext == '.pdf':
+        return test_contact_extraction(file_path)
+    fn = EXTRACTORS.get(ext)
+    if fn is None:
+        logger.error("Unsupported file type: %s", file_path)
+        return False
+    return fn(file_path)
+
+def collect_files(path):
+    """Expand a file, directory or glob pattern into a list of test files"""
+    if os.path.isdir(path):
+        return sorted(
+            os.path.join(path, name) for name in os.listdir(path)
+            if os.path.splitext(name)[1].lower() in EXTRACTORS
+        )
+    if os.path.exists(path):
+        return [path]
+    # Fall back to treating the argument as a glob pattern
+    return sorted(glob.glob(path))
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Test PDF/DOCX extraction')
-    parser.add_argument('file_path', help='Path to the PDF or DOCX file to test')
+    parser.add_argument('path', help='PDF/DOCX file, directory, or glob pattern to test')
+    parser.add_argument('--contact-only', action='store_true',
+                        help='Only extract name/contact info from the PDF header (fast path)')
     args = parser.parse_args()
-    
-    file_path = args.file_path
-    
-    if not os.path.exists(file_path):
-        logger.error(f"File not found: {file_path}")
+
+    files = collect_files(args.path)
+    run_one = partial(process_one, contact_only=args.contact_only)
+
+    if not files:
+        logger.error(f"No files found for: {args.path}")
         sys.exit(1)
-    
-    if file_path.lower().endswith('.pdf'):
-        success = test_pdf_extraction(file_path)
-    elif file_path.lower().endswith('.docx'):
-        success = test_docx_extraction(file_path)
+
+    if len(files) == 1:
+        results = [run_one(files[0])]
     else:
-        logger.error(f"Unsupported file type: {file_path}")
-        sys.exit(1)
-    
-    if success:
-        logger.info("Extraction test completed successfully")
+        # The extraction backends do their work in C with the GIL
+        # released, but the parsing helpers are pure Python - a process
+        # pool scales both; chunksize amortizes the IPC per task
+        logger.info(f"Processing {len(files)} files across {os.cpu_count()} workers")
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(run_one, files, chunksize=4))
+
+    failed = [f for f, ok in zip(files, results) if not ok]
+    if not failed:
+        logger.info(f"Extraction test completed successfully for {len(files)} file(s)")
     else:
-        logger.error("Extraction test failed")
+        logger.error(f"Extraction test failed for {len(failed)} of {len(files)} file(s): {failed}")
         sys.exit(1)
 